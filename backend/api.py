@@ -7,12 +7,15 @@ import os
 import traceback
 import shutil
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import platform
 import subprocess
 import base64
+import hashlib
+from html import escape as _html_escape
+from concurrent.futures import ThreadPoolExecutor
 
-from backend.fsutil import atomic_write_text
+from backend.fsutil import atomic_write_bytes, read_card_id, read_text_utf8
 from backend.lockutil import SyncLock, SyncLockError
 
 log = logging.getLogger("suksukidx")
@@ -45,6 +48,9 @@ from backend.htmlops import (
     strip_back_to_master,
     adjust_paths_for_folder,
     extract_inner_html_only,
+    find_card_span,
+    scan_card_meta,
+    card_title_h2,
 )
 
 from backend.thumbops import (
@@ -57,10 +63,10 @@ from backend.thumbops import (
 from backend.card_registry import CardRegistry
 
 try:
-    from bs4 import BeautifulSoup, Comment
+    from bs4 import BeautifulSoup, NavigableString
 except Exception:
     BeautifulSoup = None
-    Comment = None
+    NavigableString = None
 
 # -------- 상수 --------
 from backend.constants import (
@@ -71,6 +77,27 @@ from backend.constants import (
     DEFAULT_LOCK_PATH,
 )
 
+# _prefix_resource_for_ui용: 주석 또는 시작 태그 1개(따옴표 값은 통째로 소비) / 태그 안 속성 1개
+_TAG_OR_COMMENT_RE = re.compile(
+    r"""<!--[\s\S]*?-->"""
+    r"""|<[A-Za-z][^\s/>]*(?:\s+[^\s"'>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]+))?|\s*/)*\s*>"""
+)
+_TAG_ATTR_RE = re.compile(r"""([^\s"'>/=]+)(\s*=\s*)("[^"]*"|'[^']*'|[^\s"'>]+)""")
+
+# 신규 폴더용 기본 카드 골격(_ensure_cards_for_new_folders)
+_NEW_CARD_TEMPLATE = (
+    '<div class="card" data-card="{name_attr}"{created_attr}>'
+    '<div class="card-head"><h2>{name_text}</h2></div>'
+    '<div class="inner"><!-- 새 카드 기본 본문 --></div>'
+    "</div>"
+)
+
+# child index 렌더/기록 병렬 워커 수(상한 8)
+_PUSH_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+# sanitizer 메트릭 키(push 루프의 누적 리스트 인덱스 순서)
+_SAN_METRIC_KEYS = ("removed_nodes", "removed_attrs", "unwrapped_tags", "blocked_urls")
+
 # sanitizer 로그 토글
 SAN_VERBOSE = os.getenv("SUKSUKIDX_SAN_VERBOSE") == "1"
 
@@ -80,6 +107,32 @@ SAN_VERBOSE = os.getenv("SUKSUKIDX_SAN_VERBOSE") == "1"
 # 실배포에서는 사용하지 말고, 개발/테스트시에만 사용하세요.
 
 
+# UTC 오프셋(초) → tzinfo 캐시
+_TZ_BY_OFFSET: Dict[int, timezone] = {}
+
+
+def _local_isoformat(ts: float) -> str:
+    """
+    타임스탬프를 로컬 시간대 ISO 문자열(초 단위)로.
+    naive datetime 생성 후 astimezone() 왕복 대신 localtime의 tm_gmtoff로
+    해당 시각의 오프셋(DST 포함)을 바로 얻어 tz-aware datetime을 만든다.
+    """
+    offset = time.localtime(ts).tm_gmtoff
+    tz = _TZ_BY_OFFSET.get(offset)
+    if tz is None:
+        tz = _TZ_BY_OFFSET[offset] = timezone(timedelta(seconds=offset))
+    return datetime.fromtimestamp(ts, tz).isoformat(timespec="seconds")
+
+
+def _as_bool(value: Any) -> Optional[bool]:
+    """data-hidden 등 카드 메타 속성값을 bool로 해석(없으면 None)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return bool(value)
+
+
 # -------- 메인 API --------
 class MasterApi:
     """
@@ -98,6 +151,12 @@ class MasterApi:
         self._resource_dir_str = str(base_dir / RESOURCE_DIR)
         self._master_index_path_str = str(Path(self._resource_dir_str) / MASTER_INDEX)
 
+        # 내부용 Path는 한 번만 만들어 재사용(호출마다 Path 파싱/생성 방지)
+        self._base_path = Path(self._base_dir_str)
+        self._master_content_path = Path(self._master_content_path_str)
+        self._resource_path = Path(self._resource_dir_str)
+        self._master_index_path = Path(self._master_index_path_str)
+
         # ID 레지스트리: backend/.suksukidx.registry.json 기준
         self._registry = CardRegistry(
             registry_path=base_dir / BACKEND_DIR / ".suksukidx.registry.json",
@@ -110,66 +169,155 @@ class MasterApi:
         default_lock = base_dir / DEFAULT_LOCK_PATH
         self._lock_path = Path(env_lock) if env_lock else default_lock
 
+        # _write 중복 기록 방지 메모: {경로: (내용/상태 해시, (mtime_ns, size))}
+        self._write_memo: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+        # _try_read 텍스트 캐시: {경로: ((mtime_ns, size), 텍스트)} — 읽은 적 있는 파일만
+        self._read_memo: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+        # sync 1회 동안 공유하는 resource/ 폴더 스냅샷(sync 밖에서는 None)
+        self._scan_cache: Optional[Dict[str, "os.DirEntry[str]"]] = None
+
+        # 신규 폴더 머지 메모: (폴더/ID 구성, 마지막 출력 HTML)
+        # - 출력 문자열은 곧바로 _write → _read_memo에 같은 객체로 들어가므로 추가 메모리 없음
+        # - 해시 대신 문자열 비교: 같으면 동일 객체(즉시), 다르면 첫 차이에서 종료 → encode/해시 0회
+        self._merge_memo: Optional[Tuple[Tuple[Tuple[str, Optional[str]], ...], str]] = None
+
     # ---- 내부 Path 헬퍼 ----
     def _p_base_dir(self) -> Path:
-        return Path(self._base_dir_str)
+        return self._base_path
 
     def _p_master_content(self) -> Path:
-        return Path(self._master_content_path_str)
+        return self._master_content_path
 
     def _p_resource_dir(self) -> Path:
-        return Path(self._resource_dir_str)
+        return self._resource_path
 
     def _p_master_index(self) -> Path:
-        return Path(self._master_index_path_str)
+        return self._master_index_path
 
     # ---- 파일 IO ----
+    def _try_read(self, p: Union[str, Path]) -> Optional[str]:
+        """
+        파일이 없으면 None(exists 선검사 없이 stat/open 실패로 판정).
+        sync 단계마다 같은 master_content를 다시 읽지 않도록,
+        (mtime_ns, size)가 그대로면 마지막으로 읽은/쓴 텍스트를 재사용한다.
+        """
+        path = os.fspath(p)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._read_memo.pop(path, None)
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        memo = self._read_memo.get(path)
+        if memo is not None and memo[0] == sig:
+            return memo[1]
+        try:
+            text = read_text_utf8(path)
+        except FileNotFoundError:
+            self._read_memo.pop(path, None)
+            return None
+        self._read_memo[path] = (sig, text)
+        return text
+
     def _read(self, p: Union[str, Path]) -> str:
-        path_obj = Path(p)
-        return path_obj.read_text(encoding="utf-8") if path_obj.exists() else ""
+        text = self._try_read(p)
+        return text if text is not None else ""
+
+    def _write_memo_hit(self, path: str, key: bytes) -> bool:
+        """직전에 같은 key로 기록했고, 그 뒤 파일이 바뀌지 않았으면 True."""
+        memo = self._write_memo.get(path)
+        if memo is None or memo[0] != key:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == memo[1]
+
+    def _write_memo_put(self, path: str, key: bytes) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._write_memo.pop(path, None)
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        self._write_memo[path] = (key, sig)
+        return sig
 
     def _write(self, p: Union[str, Path], s: str) -> None:
-        # 모든 산출물 저장은 원자적 write로 고정
-        path_obj = Path(p)
-        path_obj.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(str(path_obj), s, encoding="utf-8", newline="\n")
+        # 모든 산출물 저장은 원자적 write로 고정(상위 폴더 생성도 atomic_write_* 가 담당)
+        # - 내용이 직전 기록과 같고 디스크 파일도 그대로면 tmp+fsync+rename 생략
+        path = os.fspath(p)
+        data = s.encode("utf-8")
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        if self._write_memo_hit(path, key):
+            return
+        atomic_write_bytes(path, data)
+        sig = self._write_memo_put(path, key)
+        # 읽기 캐시 대상(= 앞서 _try_read로 읽은 파일)이면 방금 쓴 내용으로 갱신
+        # (\r 포함 시 읽기 쪽 줄바꿈 정규화와 달라지므로 캐시하지 않음)
+        if path in self._read_memo:
+            if sig is not None and "\r" not in s:
+                self._read_memo[path] = (sig, s)
+            else:
+                self._read_memo.pop(path, None)
+
+    @staticmethod
+    def _scan_resource_dirs(resource_dir: Path) -> Dict[str, "os.DirEntry[str]"]:
+        """
+        resource/ 바로 아래 폴더를 os.scandir 1회로 스냅샷한다({이름: DirEntry}).
+        카드마다 exists()/is_dir()/stat()을 반복 호출하지 않기 위한 용도.
+        """
+        try:
+            with os.scandir(resource_dir) as it:
+                return {e.name: e for e in it if e.is_dir()}
+        except OSError:
+            return {}
+
+    def _resource_dir_entries(self, resource_dir: Path) -> Dict[str, "os.DirEntry[str]"]:
+        """
+        sync 중이면 공유 스냅샷을, 아니면 새로 scandir한 결과를 돌려준다.
+        (merge/rebuild/prune/push 단계가 같은 폴더 목록을 반복 스캔하지 않도록)
+        """
+        if self._scan_cache is not None and resource_dir == self._resource_path:
+            return self._scan_cache
+        return self._scan_resource_dirs(resource_dir)
 
     def _prefix_resource_for_ui(self, html: str) -> str:
         """
         backend/ui/index.html(file://)에서 innerHTML로 렌더링할 때,
         상대경로가 깨지지 않도록 resource/* 를 file:/// 절대경로로 변환한다.
         """
-        try:
-            from bs4 import BeautifulSoup as _BS
-        except Exception:
-            _BS = None
-
         if not html:
             return html
         base_dir = self._p_base_dir()
         resource_root = (base_dir / "resource").resolve()
         resource_root_uri = resource_root.as_uri().rstrip("/") + "/"
 
-        if _BS is None:
-            # bs4 없을 때: 가장 안전한 file:// 절대경로 치환
-            return (
-                html.replace('src="resource/', f'src="{resource_root_uri}')
-                .replace("src='resource/", f"src='{resource_root_uri}")
-                .replace('href="resource/', f'href="{resource_root_uri}')
-                .replace("href='resource/", f"href='{resource_root_uri}")
-            )
-
-        soup = _BS(html, "html.parser")
-        for tag in soup.find_all(True):
-            for attr in ("src", "href"):
-                value = tag.get(attr)
-                if not value or not isinstance(value, str):
-                    continue
-                if value.startswith("resource/"):
-                    # resource/foo/bar -> file:///.../resource/foo/bar
-                    tag[attr] = resource_root_uri + value[len("resource/"):]
+        if "resource/" not in html:
+            return html
 
-        return str(soup)
+        # DOM 파싱 없이 태그 단위로 훑되, 실제 src/href 속성값만 바꾼다
+        # (텍스트/주석/다른 속성값 안의 "href=resource/" 같은 문자열은 그대로)
+        # resource/foo/bar -> file:///.../resource/foo/bar
+        def _fix_attr(m: "re.Match[str]") -> str:
+            if m.group(1).lower() not in ("src", "href"):
+                return m.group(0)
+            value = m.group(3)
+            quote = value[0] if value[0] in "\"'" else ""
+            if not value.startswith("resource/", len(quote)):
+                return m.group(0)
+            fixed = quote + resource_root_uri + value[len(quote) + len("resource/"):]
+            return m.group(1) + m.group(2) + fixed
+
+        def _fix_tag(m: "re.Match[str]") -> str:
+            tag = m.group(0)
+            if tag.startswith("<!--") or "resource/" not in tag:
+                return tag
+            return _TAG_ATTR_RE.sub(_fix_attr, tag)
+
+        return _TAG_OR_COMMENT_RE.sub(_fix_tag, html)
 
     def _inline_thumb_images_for_ui(self, html: str) -> str:
         """
@@ -471,15 +619,16 @@ class MasterApi:
         master_content = self._p_master_content()
         master_index = self._p_master_index()
 
-        if master_content.exists():
-            raw_html = self._read(master_content)
+        raw_html = self._try_read(master_content)
+        if raw_html is not None:
             html_for_view = inject_thumbs_for_preview(raw_html, self._p_resource_dir())
             html_for_view = self._prefix_resource_for_ui(html_for_view)
             html_for_view = self._inline_thumb_images_for_ui(html_for_view)
             return {"html": html_for_view}
 
-        if master_index.exists():
-            inner = extract_body_inner(self._read(master_index))
+        index_html = self._try_read(master_index)
+        if index_html is not None:
+            inner = extract_body_inner(index_html)
             inner = prefix_resource_paths_for_root(inner)
             self._write(master_content, inner)
             html_for_view = inject_thumbs_for_preview(inner, self._p_resource_dir())
@@ -502,20 +651,27 @@ class MasterApi:
         fixed_html = persist_thumbs_in_master(html, self._p_resource_dir())
 
         # 저장 전에 .inner 내부의 &lt;...&gt;를 '허용 태그'만 실제 태그로 복원
-        if BeautifulSoup is not None:
+        # - 직렬화된 텍스트에 lt; 가 없으면 복원 대상이 없고, href= 가 없으면
+        #   정규화 대상도 없으므로 재파싱/재직렬화를 통째로 건너뛴다.
+        needs_unescape = _safe_unescape_api is not None and "lt;" in fixed_html
+        needs_href = "href=" in fixed_html
+        if BeautifulSoup is not None and (needs_unescape or needs_href):
             soup = BeautifulSoup(fixed_html, "html.parser")
             # 엔티티로 들어온 <a> 등을 실제 노드로 변환
-            if _safe_unescape_api is not None:
+            if needs_unescape:
                 _safe_unescape_api(soup)
 
             # href 정규화: 스킴 없는 외부 도메인에 https:// 붙이기
-            for anchor in soup.select(".inner a[href]"):
-                href = (anchor.get("href") or "").strip()
-                if href and not re.match(
-                    r"^(https?://|mailto:|tel:|#|/|\.\./)", href, re.I
-                ):
-                    if re.match(r"^(www\.|(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,})", href):
-                        anchor["href"] = f"https://{href}"
+            if needs_href:
+                for anchor in soup.select(".inner a[href]"):
+                    href = (anchor.get("href") or "").strip()
+                    if href and not re.match(
+                        r"^(https?://|mailto:|tel:|#|/|\.\./)", href, re.I
+                    ):
+                        if re.match(
+                            r"^(www\.|(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,})", href
+                        ):
+                            anchor["href"] = f"https://{href}"
 
             fixed_html = str(soup)
 
@@ -542,10 +698,10 @@ class MasterApi:
     def _push_master_to_resource(self) -> int:
         master_content = self._p_master_content()
         master_index = self._p_master_index()
-        master_html = self._read(master_content)
+        master_html = self._try_read(master_content)
         if not master_html:
             # Case B: master_index는 있는데 master_content만 없는 경우 → 의도적 삭제로 간주, 푸시 스킵
-            if (not master_content.exists()) and master_index.exists():
+            if master_html is None and master_index.exists():
                 log.info("[push] skip: master_content missing while master_index exists (treat as intentional delete; no bootstrap)")
 
             else:
@@ -561,16 +717,27 @@ class MasterApi:
         block_count = 0
         resource_dir = self._p_resource_dir()
 
+        # resource/ 폴더 스냅샷(카드별 stat 대신 dict 조회, ID/CSS 배포도 같은 목록 사용)
+        dir_entries = self._resource_dir_entries(resource_dir)
+
         # P3-1: resource/ 폴더에 대한 카드 ID 보장 (.suksukidx.id)
         try:
-            folder_id_map = ensure_card_ids(resource_dir)
+            folder_id_map = ensure_card_ids(resource_dir, dir_entries.values())
         except Exception as exc:
             folder_id_map = {}
             log.warning("[id] ensure_card_ids failed in push: %s", str(exc))
 
         cards_for_master: List[Dict[str, Any]] = []
+        # child index 입력: DOM/sanitize를 카드당 1회만 돌도록 첫 루프에서 함께 수집
+        per_card_plan: List[Dict[str, Any]] = []
 
         hidden_count = 0
+        # data-created-at / data-card-id 주입으로 soup가 바뀌었는지
+        soup_dirty = False
+        # 폴더가 없는 카드용 data-created-at 대체값(지연 계산)
+        now_iso: Optional[str] = None
+        # sanitizer 메트릭 누적(_SAN_METRIC_KEYS 순서)
+        san_totals = [0, 0, 0, 0]
 
         for card_div in soup.find_all("div", class_="card"):
             heading = card_div.find("h2")
@@ -582,46 +749,37 @@ class MasterApi:
                 continue
             block_count += 1
 
+            # 루프 내 반복 조회를 줄이기 위해 attrs dict를 로컬로 바인딩
+            attrs = card_div.attrs
+
             # --- 생성 시각 메타 보완: 없으면 폴더 mtime 기준으로 채움 ---
-            if not card_div.get("data-created-at"):
+            if not attrs.get("data-created-at"):
                 created_at: Optional[str] = None
-                folder_path = resource_dir / card_title
+                entry = dir_entries.get(card_title)
                 try:
-                    if folder_path.exists() and folder_path.is_dir():
-                        ts = folder_path.stat().st_mtime
-                        dt = datetime.fromtimestamp(ts).astimezone()
-                        created_at = dt.isoformat(timespec="seconds")
+                    if entry is not None:
+                        # DirEntry.stat()은 결과를 캐시하므로 추가 syscall 없음
+                        created_at = _local_isoformat(entry.stat().st_mtime)
                 except Exception:
                     created_at = None
                 if created_at is None:
-                    try:
-                        dt = datetime.now().astimezone()
-                        created_at = dt.isoformat(timespec="seconds")
-                    except Exception:
-                        created_at = None
+                    # 현재 시각은 push 1회당 한 번만 계산
+                    if now_iso is None:
+                        try:
+                            now_iso = _local_isoformat(time.time())
+                        except Exception:
+                            now_iso = ""
+                    created_at = now_iso or None
                 if created_at:
-                    card_div["data-created-at"] = created_at
+                    attrs["data-created-at"] = created_at
+                    soup_dirty = True
 
             # --- P3-2: 메타 읽기 ---
-            def _as_bool(value: Any) -> Optional[bool]:
-                if value is None:
-                    return None
-                if isinstance(value, str):
-                    return value.strip().lower() == "true"
-                return bool(value)
-
-            meta_hidden = _as_bool(card_div.get("data-hidden"))
+            meta_hidden = _as_bool(attrs.get("data-hidden"))
 
+            raw_order = attrs.get("data-order")
             try:
-                meta_order = (
-                    int(card_div.get("data-order"))
-                    if card_div.get("data-order")
-                    not in (
-                        None,
-                        "",
-                    )
-                    else None
-                )
+                meta_order = int(raw_order) if raw_order not in (None, "") else None
             except Exception:
                 meta_order = None
 
@@ -631,7 +789,9 @@ class MasterApi:
             # P3-1: 제목(=폴더명 가정)으로 card_id 주입
             card_id = folder_id_map.get(card_title)
             if card_id:
-                card_div["data-card-id"] = card_id
+                if attrs.get("data-card-id") != card_id:
+                    attrs["data-card-id"] = card_id
+                    soup_dirty = True
             else:
                 log.warning("[id] no card_id for title='%s'", card_title)
 
@@ -640,16 +800,11 @@ class MasterApi:
                 str(card_div), return_metrics=True
             )
 
-            # 누적치를 sync 메트릭으로 올리기 위해 임시 저장
-            if not hasattr(self, "_san_metrics"):
-                self._san_metrics = {
-                    "removed_nodes": 0,
-                    "removed_attrs": 0,
-                    "unwrapped_tags": 0,
-                    "blocked_urls": 0,
-                }
-            for k, v in san_metrics.items():
-                self._san_metrics[k] += v
+            # 누적치는 로컬 리스트에 모았다가 루프 종료 후 한 번만 반영
+            san_totals[0] += san_metrics["removed_nodes"]
+            san_totals[1] += san_metrics["removed_attrs"]
+            san_totals[2] += san_metrics["unwrapped_tags"]
+            san_totals[3] += san_metrics["blocked_urls"]
 
             # 카드별 상세 로그
             if SAN_VERBOSE and any(san_metrics.values()):
@@ -660,7 +815,14 @@ class MasterApi:
                     san_metrics.get("removed_attrs", 0),
                     san_metrics.get("unwrapped_tags", 0),
                     san_metrics.get("blocked_urls", 0),
-                )                
+                )
+
+            # child용 본문은 썸네일 보정 이전의 정화본 기준(기존 child 루프와 동일)
+            inner_for_folder = adjust_paths_for_folder(
+                extract_inner_html_only(cleaned_div_html),
+                card_title,
+                for_resource_master=False,
+            )
 
             cleaned_div_html = ensure_thumb_in_head(
                 cleaned_div_html, card_title, resource_dir
@@ -677,9 +839,21 @@ class MasterApi:
 
             # 썸네일 경로
             safe_name = _thumb_safe_name(card_title)
-            thumb_rel_for_master = None
-            if (resource_dir / card_title / "thumbs" / f"{safe_name}.jpg").exists():
-                thumb_rel_for_master = f"{card_title}/thumbs/{safe_name}.jpg"
+            has_thumb = card_title in dir_entries and os.path.isfile(
+                os.path.join(dir_entries[card_title].path, "thumbs", f"{safe_name}.jpg")
+            )
+            thumb_rel_for_master = (
+                f"{card_title}/thumbs/{safe_name}.jpg" if has_thumb else None
+            )
+
+            per_card_plan.append(
+                {
+                    "title": card_title,
+                    "card_id": card_id,
+                    "inner_for_folder": inner_for_folder,
+                    "thumb_src": f"thumbs/{safe_name}.jpg" if has_thumb else None,
+                }
+            )
 
             # master 렌더 입력
             # 숨김(meta_hidden=True) 카드는 master_index에서 제외(렌더러 의존 없이 보장)
@@ -695,8 +869,15 @@ class MasterApi:
                     }
                 )
 
+        # sanitizer 누적치를 sync 메트릭으로 올리기 위해 임시 저장
+        san_acc = getattr(self, "_san_metrics", None)
+        if san_acc is None:
+            san_acc = self._san_metrics = dict.fromkeys(_SAN_METRIC_KEYS, 0)
+        for key, value in zip(_SAN_METRIC_KEYS, san_totals):
+            san_acc[key] += value
+
         # CSS 자산 보장 + 파일명 획득
-        css_basename = ensure_css_assets(resource_dir)  # e.g., master.<HASH>.css
+        css_basename = ensure_css_assets(resource_dir, dir_entries.values())  # e.g., master.<HASH>.css
 
         # master/child 모두 최종 렌더 후 파일 기록
         # master_index 순서는 master_content.html의 카드 등장 순서를 그대로 따른다
@@ -704,49 +885,63 @@ class MasterApi:
         self._write(self._p_master_index(), master_html)
 
         # master_content.html에도 data-card-id가 채워진 soup를 반영 (P3-1)
+        # - 실제로 메타가 바뀐 경우에만 전체 문서를 다시 직렬화/기록
         try:
-            self._write(self._p_master_content(), str(soup))
+            if soup_dirty:
+                self._write(self._p_master_content(), str(soup))
         except Exception as exc:
             log.warning("[push] failed to persist data-card-id into master_content: %s", str(exc))
 
-        # child
-        for card_div in soup.find_all("div", class_="card"):
-            heading = card_div.find("h2")
-            if not heading:
-                continue
-            title = heading.get_text(strip=True)
-            if not title:
-                continue
+        # child (첫 루프에서 수집한 plan 재사용: DOM 재순회/재정화 없음)
+        # 같은 제목 카드가 여러 개면 기존처럼 마지막 카드가 이기도록 제목 기준으로 정리
+        child_plans: Dict[str, Dict[str, Any]] = {}
+        for plan in per_card_plan:
+            title = plan["title"]
 
             # 🔹 파일시스템에 폴더가 실제로 존재할 때만 child index 생성
-            folder_path = resource_dir / title
-            if not (folder_path.exists() and folder_path.is_dir()):
+            if title not in dir_entries:
                 log.info("[push] skip child for missing folder: %s", title)
                 continue
-
-            card_id = folder_id_map.get(title)
-
-            cleaned_div_html, _ = sanitize_for_publish(
-                str(card_div), return_metrics=True
-            )
-            inner_only = extract_inner_html_only(cleaned_div_html)
-            inner_for_folder = adjust_paths_for_folder(
-                inner_only, title, for_resource_master=False
+            child_plans.pop(title, None)
+            child_plans[title] = plan
+
+        def _emit_child(plan: Dict[str, Any]) -> None:
+            title = plan["title"]
+            path = os.path.join(dir_entries[title].path, "index.html")
+            # 렌더 입력이 지난번과 같고 파일도 그대로면 렌더 자체를 생략
+            state = "\0".join(
+                (
+                    title,
+                    plan["inner_for_folder"],
+                    plan["thumb_src"] or "",
+                    css_basename,
+                    plan["card_id"] or "",
+                )
             )
-
-            # 썸네일 다시 계산
-            safe_name = _thumb_safe_name(title)
-            has_thumb = (resource_dir / title / "thumbs" / f"{safe_name}.jpg").exists()
-            thumb_src = f"thumbs/{safe_name}.jpg" if has_thumb else None
-
+            state_key = hashlib.blake2b(
+                state.encode("utf-8"), digest_size=16, person=b"child-state"
+            ).digest()
+            if self._write_memo_hit(path, state_key):
+                return
             child_html = render_child_index(
                 title=title,
-                html_body=inner_for_folder,
-                thumb_src=thumb_src,
+                html_body=plan["inner_for_folder"],
+                thumb_src=plan["thumb_src"],
                 css_basename=css_basename,
-                card_id=card_id,
+                card_id=plan["card_id"],
             )
-            self._write(folder_path / "index.html", child_html)
+            self._write(path, child_html)
+            self._write_memo_put(path, state_key)
+
+        # 카드별 렌더+원자적 기록(fsync 대기)은 서로 독립 → 스레드로 I/O 대기를 겹친다
+        if len(child_plans) > 1:
+            with ThreadPoolExecutor(max_workers=_PUSH_WORKERS) as pool:
+                futures = [pool.submit(_emit_child, plan) for plan in child_plans.values()]
+                for fut in futures:
+                    fut.result()
+        else:
+            for plan in child_plans.values():
+                _emit_child(plan)
 
         log.info("[push] ok=True blocks=%s css=%s", block_count, css_basename)
 
@@ -789,12 +984,7 @@ class MasterApi:
                 }
 
                 # sanitizer 누적치 초기화
-                self._san_metrics = {
-                    "removed_nodes": 0,
-                    "removed_attrs": 0,
-                    "unwrapped_tags": 0,
-                    "blocked_urls": 0,
-                }
+                self._san_metrics = dict.fromkeys(_SAN_METRIC_KEYS, 0)
 
                 # 1) 썸네일/리소스 스캔
                 scan_rc = run_sync_all(
@@ -809,6 +999,9 @@ class MasterApi:
                     scan_ok = False
                     metrics["scanRc"] = -1
 
+                # 썸네일 스캔 이후의 resource/ 폴더 목록을 이번 sync 전체에서 공유
+                self._scan_cache = self._scan_resource_dirs(resource_dir)
+
                 if not scan_ok:
                     errors.append(
                         "DEBUG: SUKSUKIDX_FAIL_SCAN=1로 인해 스캔을 실패로 강제 설정"
@@ -833,11 +1026,7 @@ class MasterApi:
                 try:
                     if os.getenv("SUKSUKIDX_AUTO_MERGE_NEW", "1") != "0":
                         master_content_path = self._p_master_content()
-                        current_master_html = (
-                            master_content_path.read_text(encoding="utf-8")
-                            if master_content_path.exists()
-                            else ""
-                        )
+                        current_master_html = self._read(master_content_path)
                         merged_html, added_count = self._ensure_cards_for_new_folders(
                             current_master_html
                         )
@@ -885,14 +1074,14 @@ class MasterApi:
 
                         # 레지스트리 GC: prune으로 제거된 card_id 들을 registry 에서도 정리
                         removed_ids = prune_result.get("removed_card_ids") or []
-                        for cid in removed_ids:
+                        if removed_ids:
                             try:
-                                removed_reg = self._registry.remove_by_card_id(cid)
-                                if removed_reg:
+                                # 한 번 로드/필터/저장으로 일괄 제거
+                                for cid in self._registry.remove_by_card_ids(removed_ids):
                                     log.info("[registry] GC removed entry from prune id=%s", cid)
 
                             except Exception as exc:
-                                msg = f"레지스트리 GC 실패(id={cid}): {exc}"
+                                msg = f"레지스트리 GC 실패(ids={','.join(removed_ids)}): {exc}"
                                 log.error("[registry] %s", msg)
                                 errors.append(msg)
 
@@ -924,39 +1113,52 @@ class MasterApi:
                 #    - 반드시 push 이후에 실행해서
                 #      .suksukidx.id / data-card-id 가 동기화된 최종 master_content 기준으로 갱신
                 try:
-                    reg = self._registry.bootstrap_from_master(self._p_master_content())
-                    if isinstance(reg, dict):
-                        metrics["idRegistryItems"] = len(reg.get("items", []))
-
-                        # P5: 썸네일 실존 여부에 맞게 thumb_source 정리
-                        items = reg.get("items") or []
-                        resource_dir = self._p_resource_dir()
-
-                        for item in items:
-                            cid = (item.get("id") or "").strip()
-                            folder = (item.get("folder") or "").strip()
-                            if not cid or not folder:
-                                continue
-
-                            safe_name = _thumb_safe_name(folder)
-                            thumb_file = (
-                                resource_dir / folder / "thumbs" / f"{safe_name}.jpg"
-                            )
-
-                            # 1) 썸네일 파일이 없는데 thumb_source가 남아 있으면 → None으로 클리어
-                            if (not thumb_file.exists()) and item.get("thumb_source"):
-                                try:
-                                    self._registry.upsert_item(
-                                        card_id=cid,
-                                        folder=folder,
-                                        thumb_source=None,
-                                    )
-                                    log.info("[registry] cleared thumb_source for id=%s (folder=%s, file missing)", cid, folder)
-
-                                except Exception as exc2:
-                                    msg = f"레지스트리 thumb_source 정리 실패(id={cid}): {exc2}"
-                                    log.error("[registry] %s", msg)
-                                    errors.append(msg)
+                    # bootstrap 저장 + thumb_source 정리를 한 번의 기록으로 묶는다
+                    with self._registry.batch():
+                        # push가 방금 쓴 master_content는 읽기 캐시에서 그대로 넘긴다
+                        mc = self._p_master_content()
+                        reg = self._registry.bootstrap_from_master(
+                            mc, html=self._try_read(mc)
+                        )
+                        if isinstance(reg, dict):
+                            metrics["idRegistryItems"] = len(reg.get("items", []))
+
+                            # P5: 썸네일 실존 여부에 맞게 thumb_source 정리
+                            items = reg.get("items") or []
+                            # 항목별 Path 조립 대신 문자열 경로(os.path)로 확인
+                            resource_root = self._resource_dir_str
+
+                            for item in items:
+                                cid = (item.get("id") or "").strip()
+                                folder = (item.get("folder") or "").strip()
+                                if not cid or not folder:
+                                    continue
+
+                                # thumb_source가 없으면 확인할 필요도 없음(stat 생략)
+                                if not item.get("thumb_source"):
+                                    continue
+
+                                thumb_file = os.path.join(
+                                    resource_root,
+                                    folder,
+                                    "thumbs",
+                                    f"{_thumb_safe_name(folder)}.jpg",
+                                )
+
+                                # 1) 썸네일 파일이 없는데 thumb_source가 남아 있으면 → None으로 클리어
+                                if not os.path.exists(thumb_file):
+                                    try:
+                                        self._registry.upsert_item(
+                                            card_id=cid,
+                                            folder=folder,
+                                            thumb_source=None,
+                                        )
+                                        log.info("[registry] cleared thumb_source for id=%s (folder=%s, file missing)", cid, folder)
+
+                                    except Exception as exc2:
+                                        msg = f"레지스트리 thumb_source 정리 실패(id={cid}): {exc2}"
+                                        log.error("[registry] %s", msg)
+                                        errors.append(msg)
 
                 except Exception as exc:
                     errors.append(f"ID 레지스트리 갱신 실패: {exc}")
@@ -1045,6 +1247,9 @@ class MasterApi:
                 },
             }
 
+        finally:
+            self._scan_cache = None
+
     def _ensure_cards_for_new_folders(self, master_html: str) -> Tuple[str, int]:
         """
         master_content.html이 이미 존재하는 상태에서,
@@ -1063,6 +1268,41 @@ class MasterApi:
         if BeautifulSoup is None:
             return master_html, 0
 
+        resource_dir = self._p_resource_dir()
+
+        # 0-1) resource/ 폴더와 각 폴더의 카드 ID(.suksukidx.id)를 먼저 수집
+        #      scandir 1회: DirEntry가 is_dir()/stat() 결과를 캐시하므로 폴더별 추가 stat 없음
+        folders: List[Tuple["os.DirEntry[str]", Optional[str]]] = []
+        for folder in sorted(
+            self._resource_dir_entries(resource_dir).values(), key=lambda e: e.name
+        ):
+            name = folder.name
+            if name.startswith(".") or name.lower() == "thumbs":
+                continue
+
+            # 폴더의 카드 ID 읽기 (.suksukidx.id) — exists() 대신 바로 열기
+            card_id: Optional[str] = None
+            try:
+                with open(
+                    os.path.join(folder.path, ".suksukidx.id"), encoding="utf-8"
+                ) as fp:
+                    card_id = fp.read().strip() or None
+            except Exception:
+                card_id = None
+            folders.append((folder, card_id))
+
+        # 0-2) 폴더/ID 구성이 지난 호출과 같고 입력이 지난 출력 그대로면
+        #      결과도 같으므로(멱등) HTML 파싱 없이 바로 반환
+        fs_sig = tuple((folder.name, card_id) for folder, card_id in folders)
+        if self._merge_memo == (fs_sig, master_html):
+            return master_html, 0
+
+        # 0-3) 정규식 사전 검사: 모든 폴더가 이미 카드로 있고 rename/중복 정리 대상도 없으면
+        #      (사용자 저장 직후처럼 입력만 바뀐 경우) bs4 파싱 없이 원문 그대로 반환
+        if master_html.strip() and self._merge_is_noop(master_html, folders):
+            self._merge_memo = (fs_sig, master_html)
+            return master_html, 0
+
         # 0) soup 준비
         if not master_html.strip():
             soup = BeautifulSoup("<div id='content'></div>", "html.parser")
@@ -1075,12 +1315,22 @@ class MasterApi:
         existing_names: set[str] = set()
         id_to_card: dict[str, Any] = {}
         name_to_cards: dict[str, list[Any]] = {}
+        # 카드별 제목 <h2> 캐시(id(card) → Tag|None): select_one 트리 탐색은 카드당 1회만
+        h2_by_card: dict[int, Any] = {}
+        # 카드별 data-card-id(strip) 캐시(id(card) → str): 중복 판정 때 속성 재조회 생략
+        id_of_card: dict[int, str] = {}
+
+        def _card_h2(card_el: Any) -> Any:
+            key = id(card_el)
+            if key not in h2_by_card:
+                h2_by_card[key] = card_title_h2(card_el)
+            return h2_by_card[key]
 
         for card in root_container.find_all("div", class_="card"):
             # 이름 우선순위: data-card → <h2> 텍스트
             name_attr = (card.get("data-card") or "").strip()
             if not name_attr:
-                h2_tag = card.select_one(".card-head h2") or card.find("h2")
+                h2_tag = _card_h2(card)
                 if h2_tag:
                     name_attr = (h2_tag.get_text(strip=True) or "").strip()
 
@@ -1089,31 +1339,20 @@ class MasterApi:
                 name_to_cards.setdefault(name_attr, []).append(card)
 
             cid = (card.get("data-card-id") or "").strip()
+            id_of_card[id(card)] = cid
             if cid:
                 id_to_card[cid] = card
 
         added_count = 0
-        resource_dir = self._p_resource_dir()
+        new_cards_html: List[str] = []
+        # rename/중복 제거로 DOM이 실제로 바뀌었는지(아니면 원문을 그대로 돌려줌)
+        dom_changed = False
 
-        # 2) resource/ 폴더 스캔하면서
+        # 2) resource/ 폴더를 돌면서
         #    - 같은 ID의 카드가 있으면 rename 처리(+중복 카드 정리)
         #    - 그렇지 않고 새 폴더명이면 새 카드 생성
-        for folder in sorted(resource_dir.iterdir(), key=lambda p: p.name):
-            if not folder.is_dir():
-                continue
+        for folder, card_id in folders:
             name = folder.name
-            if name.startswith(".") or name.lower() == "thumbs":
-                continue
-
-            # 2-1) 폴더의 카드 ID 읽기 (.suksukidx.id)
-            card_id: Optional[str] = None
-            id_file = folder / ".suksukidx.id"
-            try:
-                if id_file.exists():
-                    val = id_file.read_text(encoding="utf-8").strip()
-                    card_id = val or None
-            except Exception:
-                card_id = None
 
             # 2-2) ID 기준 rename 감지
             #      - 폴더에는 card_id가 있고
@@ -1124,8 +1363,8 @@ class MasterApi:
 
                 # 기존 이름(우선 data-card, 없으면 <h2>)
                 old_name = (card_el.get("data-card") or "").strip()
+                h2_tag = _card_h2(card_el)
                 if not old_name:
-                    h2_tag = card_el.select_one(".card-head h2") or card_el.find("h2")
                     if h2_tag:
                         old_name = (h2_tag.get_text(strip=True) or "").strip()
 
@@ -1134,13 +1373,24 @@ class MasterApi:
                     log.info("[id] rename detected: %s -> %s (id=%s)", old_name, name, card_id)
 
                 # data-card / data-card-id / <h2> 를 새 폴더명으로 정렬
-                card_el["data-card"] = name
-                card_el["data-card-id"] = card_id
+                # (이미 같은 값이면 건드리지 않음 → 실제 변경 여부를 dom_changed로 추적)
+                if card_el.get("data-card") != name:
+                    card_el["data-card"] = name
+                    dom_changed = True
+                if card_el.get("data-card-id") != card_id:
+                    card_el["data-card-id"] = card_id
+                    dom_changed = True
 
-                h2_tag = card_el.select_one(".card-head h2") or card_el.find("h2")
                 if h2_tag is not None:
-                    # 문자열 노드만 교체 (기존 children 보존)
-                    h2_tag.string = name
+                    contents = h2_tag.contents
+                    if not (
+                        len(contents) == 1
+                        and type(contents[0]) is NavigableString
+                        and contents[0] == name
+                    ):
+                        # 문자열 노드만 교체 (기존 children 보존)
+                        h2_tag.string = name
+                        dom_changed = True
 
                 existing_names.add(name)
 
@@ -1148,16 +1398,15 @@ class MasterApi:
                 name_to_cards.setdefault(name, []).append(card_el)
 
                 # ★ 같은 이름인데 다른 ID를 가진 중복 카드 제거
-                dup_cards = [
-                    c
-                    for c in name_to_cards.get(name, [])
-                    if c is not card_el
-                    and (c.get("data-card-id") or "").strip() != card_id
-                ]
-                for dup in dup_cards:
-                    old_id = (dup.get("data-card-id") or "").strip()
+                for dup in name_to_cards.get(name, ()):
+                    if dup is card_el:
+                        continue
+                    old_id = id_of_card.get(id(dup), "")
+                    if old_id == card_id:
+                        continue
                     log.warning("[id] remove duplicate card for folder '%s' (old_id=%s, keep_id=%s)", name, old_id, card_id)
                     dup.decompose()
+                    dom_changed = True
 
                 # 이 이름에 대해선 주 카드 하나만 남기도록 재정리
                 name_to_cards[name] = [card_el]
@@ -1171,68 +1420,120 @@ class MasterApi:
 
             # 2-4) 여기까지 왔으면 "진짜 새 폴더" → 새 카드 생성
             #      이 시점에서는 card_id 를 만들지 않는다.
-            card_div = soup.new_tag(
-                "div",
-                attrs={
-                    "class": "card",
-                    "data-card": name,
-                },
-            )
-
             # 생성 시각 메타: 폴더 mtime 우선, 없으면 현재 시각
             created_at: Optional[str] = None
             try:
-                ts = folder.stat().st_mtime
-                dt = datetime.fromtimestamp(ts).astimezone()
-                created_at = dt.isoformat(timespec="seconds")
+                created_at = _local_isoformat(folder.stat().st_mtime)
             except Exception:
                 try:
-                    dt = datetime.now().astimezone()
-                    created_at = dt.isoformat(timespec="seconds")
+                    created_at = _local_isoformat(time.time())
                 except Exception:
                     created_at = None
-            if created_at:
-                card_div["data-created-at"] = created_at
-
-            head_div = soup.new_tag("div", attrs={"class": "card-head"})
-            h2_tag = soup.new_tag("h2")
-            h2_tag.string = name
-            head_div.append(h2_tag)
-            card_div.append(head_div)
-
-            inner_div = soup.new_tag("div", attrs={"class": "inner"})
-            inner_div.append(Comment(" 새 카드 기본 본문 "))
-            card_div.append(inner_div)
-
-            root_container.append(card_div)
+            # 카드 골격은 문자열 템플릿으로 모아 두었다가 루프 뒤에 한 번에 파싱
+            # (new_tag/append 반복이나 카드마다 BeautifulSoup 생성 대신)
+            created_attr = (
+                f' data-created-at="{_html_escape(created_at)}"' if created_at else ""
+            )
+            new_cards_html.append(
+                _NEW_CARD_TEMPLATE.format(
+                    name_attr=_html_escape(name),
+                    created_attr=created_attr,
+                    name_text=_html_escape(name, quote=False),
+                )
+            )
+            # 폴더명은 유일하므로 이후 폴더의 rename/중복 정리가 새 카드를 참조할 일은 없다
             existing_names.add(name)
-            name_to_cards.setdefault(name, []).append(card_div)
             added_count += 1
 
-        return str(soup), added_count
+        if new_cards_html:
+            fragment = BeautifulSoup("".join(new_cards_html), "html.parser")
+            for card_div in list(fragment.contents):
+                root_container.append(card_div)
+
+        # 새 카드도, 실제 변경도 없으면 재직렬화 결과(공백/속성 표기 차이뿐)를 쓰지 않고
+        # 원문을 그대로 반환 → 호출 측의 불필요한 master_content 재기록/푸시를 막는다.
+        if added_count == 0 and not dom_changed and master_html.strip():
+            merged_html = master_html
+        else:
+            merged_html = str(soup)
+        self._merge_memo = (fs_sig, merged_html)
+        return merged_html, added_count
+
+    @staticmethod
+    def _merge_is_noop(
+        master_html: str, folders: List[Tuple["os.DirEntry[str]", Optional[str]]]
+    ) -> bool:
+        """
+        _ensure_cards_for_new_folders의 DOM 경로가 아무것도 바꾸지 않을 입력인지 문자열 스캔으로 판정.
+        확신할 수 없으면(h2 폴백 이름, 중복 ID 등) False → DOM 경로로 진행.
+        """
+        metas = scan_card_meta(master_html)
+        if metas is None:
+            return False
+
+        names: set[str] = set()
+        ids_by_name: Dict[str, set] = {}
+        card_by_id: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {}
+        for raw_name, raw_id, h2_text in metas:
+            name = (raw_name or "").strip()
+            if not name:
+                return False
+            cid = (raw_id or "").strip()
+            if cid:
+                if cid in card_by_id:
+                    return False
+                card_by_id[cid] = (raw_name or "", raw_id or "", h2_text)
+            names.add(name)
+            ids_by_name.setdefault(name, set()).add(cid)
+
+        for folder, card_id in folders:
+            name = folder.name
+            if card_id and card_id in card_by_id:
+                raw_name, raw_id, h2_text = card_by_id[card_id]
+                if raw_name != name or raw_id != card_id:
+                    return False
+                if h2_text is not None and h2_text != name:
+                    return False
+                if ids_by_name.get(name) != {card_id}:
+                    return False
+            elif name not in names:
+                return False
+        return True
 
     # ---- 리빌드 → master_content 초기화 ----
     def rebuild_master(self) -> Dict[str, Any]:
-        if BeautifulSoup is None:
-            return {
-                "ok": False,
-                "error": "bs4가 없어 초기화 빌드를 수행할 수 없습니다.",
-            }
-
+        # 기본 카드 블럭은 문자열 템플릿으로 만들므로 HTML 파서(bs4)가 필요 없다.
         resource_dir = self._p_resource_dir()
-        blocks: list[str] = []
-        for folder_path in sorted(resource_dir.iterdir(), key=lambda x: x.name):
-            if not folder_path.is_dir():
-                continue
-            if folder_path.name.startswith(".") or folder_path.name.lower() == "thumbs":
-                continue
-            blocks.append(
-                make_clean_block_html_for_master(folder_path.name, resource_dir)
-            )
+        names = [
+            name
+            for name in sorted(self._resource_dir_entries(resource_dir))
+            if not name.startswith(".") and name.lower() != "thumbs"
+        ]
+
+        # 블럭 생성은 폴더별 thumbs 조회(I/O) 위주 → 스레드 풀로 병렬화(map이 순서 보존)
+        def _block(name: str) -> str:
+            return make_clean_block_html_for_master(name, resource_dir)
+
+        if len(names) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_PUSH_WORKERS, len(names))
+            ) as pool:
+                blocks = list(pool.map(_block, names))
+        else:
+            blocks = [_block(name) for name in names]
+
+        # 블럭/구분자를 한 리스트에 모아 join 1회로 완성(결과 문자열 추가 복사 없음)
+        parts: list[str] = []
+        for block in blocks:
+            if parts:
+                parts.append("\n\n")
+            parts.append(block)
+        added = len(blocks)
+        if added:
+            parts.append("\n")
 
-        new_html = "\n\n".join(blocks) + ("\n" if blocks else "")
-        self._write(self._p_master_content(), new_html)
-        return {"ok": True, "added": len(blocks)}
+        self._write(self._p_master_content(), "".join(parts))
+        return {"ok": True, "added": added}
 
     # ---- 산출물 정리(카드 삭제용) ----------------------------------------
     def _cleanup_folder_artifacts(self, folder_path: Path) -> Dict[str, Any]:
@@ -1352,8 +1653,16 @@ class MasterApi:
                 "error": "master_content.html이 비어 있거나 존재하지 않습니다.",
             }
 
-        soup = BeautifulSoup(html, "html.parser")
-        target = soup.select_one(f'div.card[data-card-id="{card_id}"]')
+        # 카드 1개 제거에 문서 전체 DOM은 과하므로, 문자열 구간을 먼저 찾아 잘라낸다.
+        # (구간이 애매하면 기존 bs4 경로로 폴백) target은 메타 조회용 카드 조각 DOM.
+        soup = None
+        span = find_card_span(html, card_id)
+        if span is not None:
+            target = BeautifulSoup(html[span[0]:span[1]], "html.parser").find("div")
+        else:
+            soup = BeautifulSoup(html, "html.parser")
+            # CSS 선택자 대신 속성 일치 검색(선택자 파싱 없음, card_id 따옴표에도 안전)
+            target = soup.find("div", class_="card", attrs={"data-card-id": card_id})
         if target is None:
             return {
                 "ok": False,
@@ -1376,7 +1685,26 @@ class MasterApi:
             if entry and entry.get("folder"):
                 folder_name = (entry.get("folder") or "").strip()
 
-        # 2) 레지스트리에서 찾지 못했다면 .suksukidx.id → card_id 역매핑으로 폴더명 찾기(폴백)
+        # 2) 레지스트리에서 찾지 못했다면 DOM 메타(data-card / data-folder / h2) 후보를 먼저 확인
+        #    - 폴더가 실제로 있고, 그 폴더의 .suksukidx.id가 없거나 card_id와 같을 때만 채택
+        #    - 전체 폴더 스캔(ensure_card_ids)은 이 후보가 모두 어긋날 때만
+        dom_candidates: List[str] = []
+        if not folder_name:
+            h = card_title_h2(target)
+            title = (h.get_text(strip=True) if h else "").strip()
+            data_card = (target.get("data-card") or "").strip()
+            data_folder = (target.get("data-folder") or "").strip()
+            dom_candidates = [c for c in (data_card, data_folder, title) if c]
+            for cand in dom_candidates:
+                cand_dir = resource_dir / cand
+                if not cand_dir.is_dir():
+                    continue
+                cand_id = read_card_id(str(cand_dir))
+                if cand_id is None or cand_id == card_id:
+                    folder_name = cand
+                    break
+
+        # 3) 그래도 못 찾았다면 .suksukidx.id → card_id 역매핑으로 폴더명 찾기(폴백)
         if not folder_name:
             try:
                 folder_id_map = ensure_card_ids(resource_dir)
@@ -1388,16 +1716,9 @@ class MasterApi:
                 id_to_folder = {v: k for k, v in folder_id_map.items()}
                 folder_name = id_to_folder.get(card_id)
 
-        # 3) 그래도 폴더명을 찾지 못했다면 DOM 메타에서 폴더 후보 추출(최종 폴백)
-        if not folder_name:
-            h = target.select_one(".card-head h2") or target.find("h2")
-            title = (h.get_text(strip=True) if h else "").strip()
-            data_card = (target.get("data-card") or "").strip()
-            data_folder = (target.get("data-folder") or "").strip()
-            for cand in (data_card, data_folder, title):
-                if cand:
-                    folder_name = cand
-                    break
+        # 3-1) 최종 폴백: 폴더 확인이 안 되더라도 DOM 메타의 첫 후보를 사용
+        if not folder_name and dom_candidates:
+            folder_name = dom_candidates[0]
 
         cleaned_artifacts: Dict[str, Any] = {
             "child_index_deleted": False,
@@ -1408,8 +1729,12 @@ class MasterApi:
 
         # 4) master_content에서 카드 블록 제거
         try:
-            target.decompose()
-            self._write(master_content, str(soup))
+            if span is not None:
+                new_master = html[: span[0]] + html[span[1] :]
+            else:
+                target.decompose()
+                new_master = str(soup)
+            self._write(master_content, new_master)
             removed_from_master = True
         except Exception as exc:
             msg = f"master_content 카드 제거/저장 실패: {exc}"
@@ -1639,6 +1964,7 @@ class MasterApi:
                 resource_root=self._p_resource_dir(),
                 master_content_path=self._p_master_content(),
                 master_index_path=self._p_master_index(),
+                fs_dir_names=self._scan_cache,
             ).make_report()
         applier = PruneApplier(
             resource_root=self._p_resource_dir(),
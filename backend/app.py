@@ -3,6 +3,8 @@ import sys
 import webview
 from typing import Optional
 from typing import Any
+from typing import Tuple
+from functools import lru_cache
 import os
 import tempfile
 import logging
@@ -31,18 +33,33 @@ def _show_error_box(title: str, message: str) -> None:
 def _is_protected_install_dir(base_dir: Path) -> bool:
     """
     B안: Program Files 같은 권한 제한 경로면 실행 차단.
-    - 문자열 기반 1차 감지 + 실제 쓰기 테스트 2차 감지
+    - 문자열 기반 1차 감지 + os.access / 실제 쓰기 테스트 2차 감지
     """
     s = str(base_dir).lower()
     if ("\\program files\\" in s) or ("\\program files (x86)\\" in s):
         return True
-    # 2차: 쓰기 테스트(가장 확실)
+    # 2차: os.access로 먼저 판정(파일 생성/삭제 없는 syscall 1회)
+    if not os.access(str(base_dir), os.W_OK):
+        return True
+    # Windows의 os.access는 ACL을 보지 않고 읽기 전용 속성만 확인하므로
+    # Windows(또는 SUKSUKIDX_WRITE_PROBE=1)에서만 실제 쓰기 테스트로 확정
+    if os.name != "nt" and os.getenv("SUKSUKIDX_WRITE_PROBE") != "1":
+        return False
+    # 빈 파일 생성+삭제만 확인하면 되므로 텍스트 I/O 객체 없이 os.open/close/unlink
+    test = os.path.join(str(base_dir), ".suksukidx_write_test.tmp")
     try:
-        test = base_dir / ".suksukidx_write_test.tmp"
-        test.write_text("ok", encoding="utf-8")
-        test.unlink(missing_ok=True)
+        fd = os.open(test, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        os.close(fd)
+        os.unlink(test)
         return False
-    except Exception:
+    except FileExistsError:
+        # 이전 실행이 남긴 프로브 파일: 지울 수 있으면 쓰기 가능
+        try:
+            os.unlink(test)
+            return False
+        except OSError:
+            return True
+    except OSError:
         return True
 
 class _StreamToLogger:
@@ -55,12 +72,21 @@ class _StreamToLogger:
     def write(self, msg: str) -> int:
         if not msg:
             return 0
+        # 레벨 필터에 걸리면 버퍼링/분할 없이 바로 버린다
+        if not self.logger.isEnabledFor(self.level):
+            return len(msg)
         self._buf += msg
-        while "\n" in self._buf:
-            line, self._buf = self._buf.split("\n", 1)
+        # 버퍼에는 줄바꿈이 남지 않으므로 새 조각에 없으면 그대로 모아 두기만 한다
+        if "\n" not in msg:
+            return len(msg)
+        # split 1회로 완성된 줄들과 남은 꼬리를 나눈다(줄 단위 반복 분할/재할당 없음)
+        lines = self._buf.split("\n")
+        self._buf = lines.pop()
+        log, level = self.logger.log, self.level
+        for line in lines:
             line = line.rstrip()
             if line:
-                self.logger.log(self.level, line)
+                log(level, line)
         return len(msg)
 
     def flush(self) -> None:
@@ -89,6 +115,9 @@ def _setup_logging(base_dir: Path) -> logging.Logger:
             maxBytes=2 * 1024 * 1024,
             backupCount=5,
             encoding="utf-8",
+            # print()로 흘러든 깨진 문자(서로게이트 등)로 핸들러 예외 경로를 타지 않도록
+            errors="replace",
+            # NOTE: delay=True는 쓰지 않는다 — 여기서 열기에 실패해야 %TEMP% 폴백으로 넘어간다
         )
         fh.setFormatter(fmt)
         logger.addHandler(fh)
@@ -132,25 +161,33 @@ def _resolve_base_dir() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def _resolve_index_path(base_dir: Path) -> Optional[Path]:
-    candidates = [
-        # PyInstaller onedir(6.x): <exe_dir>/_internal/backend/ui/index.html
-        base_dir / "_internal" / BACKEND_DIR / "ui" / "index.html",
-        # dev 배치: <project_root>/backend/ui/index.html
-        base_dir / BACKEND_DIR / "ui" / "index.html",
+def _ui_asset_candidates(base_dir: Path, name: str) -> Tuple[Path, ...]:
+    """
+    backend/ui 자산 후보 경로. 실행 형태에 맞는 후보를 앞에 둬서 빗나가는 exists()를 줄인다.
+    - frozen: PyInstaller onedir(6.x) <exe_dir>/_internal/backend/ui/<name> 우선
+    - dev: <project_root>/backend/ui/<name> 우선
+    """
+    internal = base_dir / "_internal" / BACKEND_DIR / "ui" / name
+    dev = base_dir / BACKEND_DIR / "ui" / name
+    if getattr(sys, "frozen", False):
+        return (internal, dev)
+    return (dev, internal)
+
+
+@lru_cache(maxsize=None)
+def _resolve_index_path(base_dir: Path) -> Optional[Tuple[Path, str]]:
+    """찾은 index.html 경로와 그 file:// URI를 함께 반환(URI 직렬화도 1회만)."""
+    candidates = _ui_asset_candidates(base_dir, "index.html") + (
         base_dir / "index.html",  # (구버전 폴백)
-    ]
+    )
     for p in candidates:
-        if p is not None and p.exists():
-            return p
+        if p.exists():
+            return p, p.as_uri()
     return None
 
+@lru_cache(maxsize=None)
 def _resolve_icon_path(base_dir: Path) -> Optional[Path]:
-    candidates = [
-        base_dir / "_internal" / BACKEND_DIR / "ui" / "suksukidx.ico",
-        base_dir / BACKEND_DIR / "ui" / "suksukidx.ico",
-    ]
-    for p in candidates:
+    for p in _ui_asset_candidates(base_dir, "suksukidx.ico"):
         if p.exists():
             return p
     return None
@@ -178,8 +215,8 @@ def main():
     resource_dir = base_dir / RESOURCE_DIR
     _ensure_dir(resource_dir)
 
-    index_path = _resolve_index_path(base_dir)
-    if index_path is None:
+    resolved_index = _resolve_index_path(base_dir)
+    if resolved_index is None:
         tried = [
             str(base_dir / "backend" / "ui" / "index.html"),
             str(base_dir / "_internal" / "backend" / "ui" / "index.html"),
@@ -190,6 +227,7 @@ def main():
 
         logger.error("[app] UI index.html not found. tried:\n  %s", "\n  ".join(tried))
         raise SystemExit(1)
+    _, index_uri = resolved_index
 
     # JS API 객체 준비
     api = MasterApi(base_dir=base_dir)
@@ -203,7 +241,7 @@ def main():
     # exe 아이콘은 PyInstaller(spec)로 처리하고, 런타임에서는 icon 인자를 넘기지 않는다.
     window = webview.create_window(
         title="쑥쑥인덱스",
-        url=index_path.as_uri(),
+        url=index_uri,
         js_api=api,  # 여기에 먼저 주입
         width=1100,
         height=800,
@@ -220,7 +258,7 @@ def main():
             pass
 
     logger.info("[app] base_dir=%s", str(base_dir))
-    logger.info("[app] url=%s", index_path.as_uri())
+    logger.info("[app] url=%s", index_uri)
 
     # 시작 (일부 구버전 백업: js_api 인자도 같이 전달)
     try:
@@ -1,15 +1,19 @@
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from typing import Tuple
 import os
+import re
 import hashlib
 import shutil
-import uuid
 import logging
+from functools import lru_cache
+from html import escape as _html_escape
+from concurrent.futures import ThreadPoolExecutor
 
 from backend.constants import PUBLISH_CSS, CSS_PREFIX
-from backend.fsutil import read_card_id, write_card_id
+from backend.fsutil import ID_FILENAME, read_card_id, write_card_id
+# dedupe_toolbar용 div 여닫기 태그 / class 토큰(data-class 등은 제외) — htmlops와 같은 정의 공유
+from backend.htmlops import _DIV_TAG_RE, _class_tokens
 
 log = logging.getLogger("suksukidx")
 
@@ -22,6 +26,16 @@ TOOLBAR_HTML = """
 </div>
 """.strip()
 
+# _escape_title / _card_block_html용: escape가 필요한 문자 / data-hidden 속성 조각(값별로 미리 생성)
+_NEEDS_ESCAPE_RE = re.compile(r"[&<>\"']")
+_DATA_HIDDEN_ATTRS = {True: ' data-hidden="true"', False: ' data-hidden="false"'}
+
+# scan_ssot 폴더별 스캔 / CSS 폴더 배포 병렬 워커 수(I/O 위주라 CPU 수의 4배, 상한 32)
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# _make_slug용: 공백(탭/줄바꿈 포함)/경로 구분자 연속 구간 → '_' 1개
+_SLUG_SEP_RE = re.compile("[ \t\r\n/%s]+" % re.escape(os.sep))
+
 
 def run_sync_all(
     resource_dir: Path, thumb_width: int = 640, *, scan_only: bool = False
@@ -49,13 +63,65 @@ def run_sync_all(
 
 
 # ---------- 카드 ID 보장 (P3-1) ----------
-def ensure_card_ids(resource_dir: Path) -> dict[str, str]:
+def _new_cid() -> str:
+    """
+    카드 ID용 UUID v4 문자열 생성.
+    - uuid.uuid4()와 같은 os.urandom(16) 기반이지만 UUID 객체/int 변환을 거치지 않는다.
+    - 버전(4)/variant 비트는 그대로 맞춰 기존 ID와 형식이 같다.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _list_card_dirs(resource_dir: Path, entries: Optional[Iterable["os.DirEntry[str]"]] = None) -> List[Path]:
+    """
+    resource/ 바로 아래 카드 폴더(숨김/'thumbs' 제외)를 이름순 Path 목록으로 반환.
+    - entries: 호출 측이 이미 scandir한 DirEntry들(예: sync 공유 스냅샷). 주어지면 다시 읽지 않는다.
+    - 목록 조회 실패(OSError)는 호출 측에서 처리
+    """
+    if entries is None:
+        with os.scandir(resource_dir) as it:
+            entries = [e for e in it if e.is_dir()]
+    names = sorted(
+        e.name
+        for e in entries
+        if e.is_dir() and not e.name.startswith(".") and e.name.lower() != "thumbs"
+    )
+    return [resource_dir / n for n in names]
+
+
+# ensure_card_ids 폴더별 ID 캐시: {폴더 경로: ((.suksukidx.id mtime_ns, size), card_id)}
+# - id 파일 자체의 (mtime_ns, size)가 그대로면 다시 열어 읽지 않는다(card_registry와 같은 키)
+_CARD_ID_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _clear_card_id_cache() -> None:
+    """ensure_card_ids ID 캐시 비우기(.suksukidx.id 를 바깥에서 고친 뒤 강제로 다시 읽을 때)."""
+    _CARD_ID_CACHE.clear()
+
+
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def ensure_card_ids(
+    resource_dir: Path, entries: Optional[Iterable["os.DirEntry[str]"]] = None
+) -> dict[str, str]:
     """
     resource/ 하위 카드 폴더에 .suksukidx.id 를 보장하고,
     {folder_name: card_id} 매핑을 반환한다.
 
     - 숨김 폴더(. 시작)와 'thumbs' 폴더는 제외
     - 중복 ID가 발견되면 후순위 폴더에 새 UUID를 발급하여 충돌을 해소
+    - entries: resource/ 폴더 DirEntry 스냅샷(선택). 주면 목록을 다시 읽지 않는다.
+    - .suksukidx.id 의 (mtime_ns, size)가 직전 호출과 같으면 캐시된 ID를 쓴다
     """
     # read_card_id / write_card_id 는 항상 존재해야 한다(패키지/패키징 일관성)
 
@@ -63,29 +129,27 @@ def ensure_card_ids(resource_dir: Path) -> dict[str, str]:
     used_ids: dict[str, str] = {}
 
     try:
-        entries = sorted(
-            [
-                p
-                for p in resource_dir.iterdir()
-                if p.is_dir() and not p.name.startswith(".")
-            ],
-            key=lambda p: p.name,
-        )
+        card_dirs = _list_card_dirs(resource_dir, entries)
     except Exception as e:
         log.warning("[id] failed to list resource dir for ids: %s", str(e))
         return {}
 
-    for d in entries:
-        if d.name.lower() == "thumbs":
-            continue
-
+    for d in card_dirs:
         dir_str = str(d)
-        cid = read_card_id(dir_str)
+        id_path = os.path.join(dir_str, ID_FILENAME)
+        sig = _file_sig(id_path)
+        cached = _CARD_ID_CACHE.get(dir_str)
+        if cached is not None and sig is not None and cached[0] == sig:
+            cid = cached[1]
+        else:
+            cid = read_card_id(dir_str)
+        written = False
 
         if not cid:
-            cid = str(uuid.uuid4())
+            cid = _new_cid()
             try:
                 write_card_id(dir_str, cid)
+                written = True
                 log.info("[id] create %s -> %s", d.name, cid)
             except Exception as e:
                 log.warning("[id] failed to write id for %s: %s", d.name, str(e))
@@ -93,9 +157,10 @@ def ensure_card_ids(resource_dir: Path) -> dict[str, str]:
 
         # 중복 ID 해소: 이미 사용 중이면 새로 발급
         if cid in used_ids and used_ids[cid] != d.name:
-            new_cid = str(uuid.uuid4())
+            new_cid = _new_cid()
             try:
                 write_card_id(dir_str, new_cid)
+                written = True
                 log.warning("[id] duplicate detected for %s (old:%s); reassigned -> %s", d.name, cid, new_cid)
                 cid = new_cid
             except Exception as e:
@@ -105,6 +170,14 @@ def ensure_card_ids(resource_dir: Path) -> dict[str, str]:
         used_ids[cid] = d.name
         folder_to_id[d.name] = cid
 
+        # 방금 기록했다면 새 id 파일 기준으로 다시 키를 잡는다
+        if written:
+            sig = _file_sig(id_path)
+        if sig is not None:
+            _CARD_ID_CACHE[dir_str] = (sig, cid)
+        else:
+            _CARD_ID_CACHE.pop(dir_str, None)
+
     return folder_to_id
 
 
@@ -113,37 +186,54 @@ def _make_slug(name: str) -> str:
     파일시스템 세이프 슬러그(최소 규칙):
     - 앞뒤 공백 제거
     - 경로 구분자 제거
-    - 공백 → '_' 치환
+    - 공백(탭/줄바꿈 포함) → '_' 치환
     (한글/숫자/일부 기호는 그대로 둡니다)
     """
-    name = name.strip().replace(os.sep, " ").replace("/", " ")
-    while "  " in name:
-        name = name.replace("  ", " ")
-    return name.replace(" ", "_")
+    return _SLUG_SEP_RE.sub("_", name.strip())
 
 
-def _iter_thumb_files(thumb_dir: Path):
-    if not thumb_dir.exists() or not thumb_dir.is_dir():
-        return
-    for p in thumb_dir.iterdir():
-        if p.is_file() and not p.name.startswith("."):
-            yield p
+def _has_any_thumb(thumb_dir: str | Path) -> bool:
+    """thumbs/ 안에 숨김이 아닌 파일이 하나라도 있으면 True(첫 항목에서 바로 종료, Path 생성 없음)."""
+    try:
+        with os.scandir(thumb_dir) as it:
+            for e in it:
+                if not e.name.startswith(".") and e.is_file():
+                    return True
+    except OSError:
+        pass
+    return False
 
 
-def _latest_mtime_of_tree(root: Path) -> float:
-    latest = root.stat().st_mtime if root.exists() else 0.0
+def _latest_mtime_of_tree(root: str | Path) -> float:
+    """
+    root(폴더 자체 포함) 아래 파일들 중 가장 최근 mtime.
+    - os.walk + Path.stat() 대신 os.scandir 스택 순회(DirEntry 재사용, Path 생성 없음)
+    - os.walk(followlinks=False)와 같이 심볼릭 링크 폴더로는 내려가지 않는다
+    """
     try:
-        for base, _, files in os.walk(root):
-            for f in files:
-                try:
-                    t = (Path(base) / f).stat().st_mtime
+        latest = os.stat(root).st_mtime
+    except OSError:
+        return 0.0
+
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        if e.is_dir():
+                            if not e.is_symlink():
+                                stack.append(e.path)
+                            continue
+                        t = e.stat().st_mtime
+                    except OSError:
+                        # 파일 접근 실패는 무시(스캔 전체 중단 방지)
+                        continue
                     if t > latest:
                         latest = t
-                except Exception:
-                    # 파일 접근 실패는 무시(스캔 전체 중단 방지)
-                    pass
-    except Exception:
-        pass
+        except OSError:
+            pass
     return latest
 
 
@@ -163,47 +253,61 @@ def scan_ssot(resource_dir: Path) -> Dict[str, Any]:
     errors = 0
 
     try:
-        entries = sorted(
-            [
-                p
-                for p in resource_dir.iterdir()
-                if p.is_dir() and not p.name.startswith(".")
-            ],
-            key=lambda p: p.name,
-        )
+        # os.scandir: DirEntry가 종류 정보를 들고 있어 is_dir()에 추가 stat이 없고 Path도 만들지 않는다
+        with os.scandir(resource_dir) as it:
+            entries = sorted(
+                (e for e in it if not e.name.startswith(".") and e.is_dir()),
+                key=lambda e: e.name,
+            )
     except Exception as e:
         log.error("[SCAN] failed to list resource dir: %s", str(e))
         return {"folders": [], "stats": {"count": 0, "thumbs": 0, "errors": 1}}
 
-    thumb_count = 0
-    for d in entries:
-        try:
-            title = d.name.replace("_", " ")
-            slug = _make_slug(d.name)
-            thumbs_dir = d / "thumbs"
-            has_thumb = any(True for _ in _iter_thumb_files(thumbs_dir))
-            if has_thumb:
-                thumb_count += 1
-
-            mtime = _latest_mtime_of_tree(d)
-            rel_path = (
-                f"{resource_dir.name}/{d.name}" if d.parent == resource_dir else str(d)
-            )
+    # scandir 결과는 모두 resource_dir 바로 아래이므로 상대 경로 접두어는 고정
+    res_prefix = resource_dir.name + "/"
 
-            folders.append(
+    def _probe(d: "os.DirEntry[str]") -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        # 워커에서는 로그를 찍지 않고 결과/오류만 돌려준다(로그는 순서대로 메인에서)
+        d_name = d.name
+        try:
+            has_thumb = _has_any_thumb(os.path.join(d.path, "thumbs"))
+            mtime = _latest_mtime_of_tree(d.path)
+            return (
                 {
-                    "slug": slug,
-                    "path": rel_path,
-                    "title": title,
+                    "slug": _make_slug(d_name),
+                    "path": res_prefix + d_name,
+                    "title": d_name.replace("_", " "),
                     "thumb_exists": bool(has_thumb),
                     "mtime": float(mtime),
-                }
+                },
+                None,
             )
-            log.info("[SCAN] %s ✓ (thumb:%s)", slug, ("Y" if has_thumb else "N"))
-
         except Exception as e:
+            return None, str(e)
+
+    # 폴더별 stat 위주 I/O → 스레드 풀로 겹쳐 실행(map이 정렬 순서 보존)
+    if len(entries) > 1:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(entries))) as ex:
+            probed = list(ex.map(_probe, entries))
+    else:
+        probed = [_probe(d) for d in entries]
+
+    thumb_count = 0
+    # 폴더별 성공 로그는 모아서 1건으로(핸들러 락/포맷을 폴더 수만큼 반복하지 않도록)
+    ok_lines: List[str] = []
+    for d, (row, err) in zip(entries, probed):
+        if row is None:
             errors += 1
-            log.warning("[SCAN] %s ⚠ %s", d.name, str(e))
+            log.warning("[SCAN] %s ⚠ %s", d.name, err)
+            continue
+        if row["thumb_exists"]:
+            thumb_count += 1
+        folders.append(row)
+        ok_lines.append(
+            f"[SCAN] {row['slug']} ✓ (thumb:{'Y' if row['thumb_exists'] else 'N'})"
+        )
+    if ok_lines and log.isEnabledFor(logging.INFO):
+        log.info("\n".join(ok_lines))
 
     return {
         "folders": folders,
@@ -212,6 +316,30 @@ def scan_ssot(resource_dir: Path) -> Dict[str, Any]:
 
 
 # ---------- CSS 해시 배포 ----------
+# backend/ui 경로(모듈 위치 기준)는 실행 중 바뀌지 않으므로 resolve는 1회만
+_UI_DIR = Path(__file__).resolve().parent / "ui"
+
+# CSS 원본 읽기 메모: {경로: ((mtime_ns, size), bytes)} — stat이 같으면 다시 읽지 않는다
+_CSS_SRC_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def _read_bytes_cached(path: Path) -> Optional[bytes]:
+    """파일이 없으면 None. (mtime_ns, size)가 직전과 같으면 메모한 bytes를 그대로 반환."""
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _CSS_SRC_CACHE.pop(key, None)
+        return None
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _CSS_SRC_CACHE.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    data = path.read_bytes()
+    _CSS_SRC_CACHE[key] = (sig, data)
+    return data
+
+
 def _read_publish_css(resource_dir: Path) -> Optional[bytes]:
     """
     publish.css 를 읽어 bytes로 반환.
@@ -221,16 +349,12 @@ def _read_publish_css(resource_dir: Path) -> Optional[bytes]:
     - 개발환경(소스 실행)에서는 기존처럼 PUBLISH_CSS(상대경로)도 fallback으로 본다.
     """
     # 1) 패키징/런타임 우선 경로: dist/.../_internal/backend/ui/publish.css
-    ui_css = Path(__file__).resolve().parent / "ui" / "publish.css"
-    if ui_css.exists():
-        return ui_css.read_bytes()
+    data = _read_bytes_cached(_UI_DIR / "publish.css")
+    if data is not None:
+        return data
 
     # 2) 기존 방식 fallback: (프로젝트 루트 기준) <base>/<PUBLISH_CSS>
-    base = resource_dir.parent
-    p = base / PUBLISH_CSS
-    if p.exists():
-        return p.read_bytes()
-    return None
+    return _read_bytes_cached(resource_dir.parent / PUBLISH_CSS)
 
 
 def _read_master_css(resource_dir: Path) -> Optional[bytes]:
@@ -239,57 +363,154 @@ def _read_master_css(resource_dir: Path) -> Optional[bytes]:
     publish.css 가 없는 환경(또는 디버그)에서 resource에 master.css를 '실제로' 배포하기 위해 필요.
     """
     # 1) 패키징/런타임 우선 경로: dist/.../_internal/backend/ui/master.css
-    ui_css = Path(__file__).resolve().parent / "ui" / "master.css"
-    if ui_css.exists():
-        return ui_css.read_bytes()
+    data = _read_bytes_cached(_UI_DIR / "master.css")
+    if data is not None:
+        return data
 
     # 2) 개발환경 fallback: (프로젝트 루트 기준) resource_dir.parent/master.css
-    base = resource_dir.parent
-    p = base / "master.css"
-    if p.exists():
-        return p.read_bytes()
-    return None
- 
+    return _read_bytes_cached(resource_dir.parent / "master.css")
 
 
-def _sha1_12(b: bytes) -> str:
-    return hashlib.sha1(b).hexdigest()[:12]
+@lru_cache(maxsize=8)
+def _fp12(b: bytes) -> str:
+    """
+    CSS 파일명용 12자리 지문(암호학적 용도 아님).
+    SHA-1을 48비트로 잘라 쓰던 것을 BLAKE2b(digest_size=6)로 — 길이는 그대로 12 hex.
+    _read_bytes_cached가 같은 bytes 객체를 돌려주므로 CSS가 그대로면 재해시하지 않는다.
+    """
+    return hashlib.blake2b(b, digest_size=6).hexdigest()
 
 
 def _write_if_changed(target: Path, data: bytes) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    if target.exists():
-        try:
-            if target.read_bytes() == data:
-                return
-        except Exception:
-            pass
-    tmp = target.with_suffix(target.suffix + ".tmp")
-    tmp.write_bytes(data)
-    tmp.replace(target)
+    # 폴더 수만큼 불리므로 Path 파생 객체 없이 문자열 경로 + os 레벨 호출로 처리
+    target_s = os.fspath(target)
+    try:
+        # 크기가 다르면 내용도 다르므로 전체 읽기/비교 생략
+        if os.stat(target_s).st_size == len(data):
+            with open(target_s, "rb") as f:
+                if f.read() == data:
+                    return
+    except FileNotFoundError:
+        # 대상이 없을 때만 상위 폴더 보장(대부분 이미 있음)
+        os.makedirs(os.path.dirname(target_s) or ".", exist_ok=True)
+    except OSError:
+        pass
+    tmp = target_s + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, target_s)
+
+
+def _write_content_addressed(target: Path, data: bytes) -> None:
+    """
+    파일명에 내용 해시가 들어간 산출물(master.<HASH>.css)용 기록.
+    같은 이름이 이미 있고 크기도 같으면 내용도 같으므로 읽어서 비교하지 않는다.
+    """
+    try:
+        if os.stat(target).st_size == len(data):
+            return
+    except OSError:
+        pass
+    _write_if_changed(target, data)
+
+
+def _link_or_write(src: Path, target: Path, data: bytes) -> None:
+    """
+    내용 주소 산출물(master.<HASH>.css)의 폴더별 사본: 루트 파일(src)에 하드링크를 건다.
+    - 같은 이름이 이미 있고 크기도 같으면 그대로 둔다(_write_content_addressed와 동일)
+    - 하드링크 불가(다른 볼륨/FAT/exFAT/권한 등)이거나 크기가 다른 기존 파일이 있으면 복사 기록으로 폴백
+    """
+    try:
+        if os.stat(target).st_size == len(data):
+            return
+    except OSError:
+        pass
+    try:
+        os.link(src, target)
+        return
+    except OSError:
+        pass
+    _write_if_changed(target, data)
 
 
 def _cleanup_old_css(dirpath: Path, keep_name: str) -> int:
     """dirpath 내 {CSS_PREFIX}.*.css 중 keep_name 이외 삭제"""
+    # glob(fnmatch) 대신 scandir 1회 + 접두/접미 비교(Path 생성 없음)
+    # "master.css"처럼 가운데가 없는 이름은 glob과 같이 제외한다
+    prefix = CSS_PREFIX + "."
+    min_len = len(prefix) + len(".css")
     removed = 0
-    if not dirpath.exists():
+    try:
+        it = os.scandir(dirpath)
+    except OSError:
         return removed
-    for p in dirpath.glob(f"{CSS_PREFIX}.*.css"):
-        if p.name != keep_name:
+    with it:
+        for e in it:
+            name = e.name
+            if (
+                name == keep_name
+                or len(name) < min_len
+                or not name.startswith(prefix)
+                or not name.endswith(".css")
+            ):
+                continue
             try:
-                p.unlink()
+                os.unlink(e.path)
                 removed += 1
             except Exception:
                 pass
     return removed
 
 
-def ensure_css_assets(resource_dir: Path) -> str:
+# ensure_css_assets 배포 메모: {폴더 경로: (CSS 파일명, 배포한 사본의 (mtime_ns, size))}
+# - 사본 파일 자체의 stat이 배포 직후와 같으면 사본/정리 상태도 그대로이므로 stat 1회로 건너뛴다
+#   (폴더 mtime은 FAT/exFAT에서 해상도가 2초라 키로 쓰지 않는다. card_registry/ID 캐시와 같은 키)
+# - 사본이 지워지거나 바뀌면 stat이 달라져 다시 배포
+_CSS_DEPLOYED: Dict[str, Tuple[str, Tuple[int, int]]] = {}
+
+
+def _css_deployed(d: Path, basename: str) -> bool:
+    key = os.fspath(d)
+    sig = _file_sig(os.path.join(key, basename))
+    return sig is not None and _CSS_DEPLOYED.get(key) == (basename, sig)
+
+
+def _mark_css_deployed(d: Path, basename: str) -> None:
+    key = os.fspath(d)
+    sig = _file_sig(os.path.join(key, basename))
+    if sig is not None:
+        _CSS_DEPLOYED[key] = (basename, sig)
+    else:
+        _CSS_DEPLOYED.pop(key, None)
+
+
+def _for_each_dir(dirs: List[Path], fn) -> None:
+    """
+    폴더별로 독립적인 파일 I/O(fn)를 실행. 폴더가 여럿이면 스레드 풀로 겹쳐 실행한다.
+    (fn에서 난 예외는 순차 실행과 같이 호출 측으로 전파)
+    """
+    if len(dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(dirs))) as ex:
+            list(ex.map(fn, dirs))
+    else:
+        for d in dirs:
+            fn(d)
+
+
+def ensure_css_assets(
+    resource_dir: Path, entries: Optional[Iterable["os.DirEntry[str]"]] = None
+) -> str:
     """
     publish.css 를 읽어 해시 파일로 배포하고, 사용해야 할 CSS 파일명을 반환.
     - 루트: resource/master.<HASH>.css
     - 각 폴더: resource/<folder>/master.<HASH>.css
     - publish.css 가 없으면 master.css를 resource 루트/각 폴더에 '실제로' 배포하고 "master.css" 반환
+    - entries: resource/ 폴더 DirEntry 스냅샷(선택). 주면 목록을 다시 읽지 않는다.
     """
     css = _read_publish_css(resource_dir)
     if css is None:
@@ -307,34 +528,33 @@ def ensure_css_assets(resource_dir: Path) -> str:
         _write_if_changed(root_target, master_css)
 
         # 각 폴더 배포
-        for d in sorted(
-            p for p in resource_dir.iterdir() if p.is_dir() and not p.name.startswith(".")
-        ):
-            if d.name.lower() == "thumbs":
-                continue
-            target = d / basename
-            _write_if_changed(target, master_css)
+        _for_each_dir(
+            _list_card_dirs(resource_dir, entries),
+            lambda d: _write_if_changed(d / basename, master_css),
+        )
 
         log.info("[css] deployed %s to root and folders (fallback)", basename)
         return basename
 
-    h = _sha1_12(css)
+    h = _fp12(css)
     basename = f"{CSS_PREFIX}.{h}.css"
 
     # 루트 배포
     root_target = resource_dir / basename
-    _write_if_changed(root_target, css)
-    _cleanup_old_css(resource_dir, basename)
+    if not _css_deployed(resource_dir, basename):
+        _write_content_addressed(root_target, css)
+        _cleanup_old_css(resource_dir, basename)
+        _mark_css_deployed(resource_dir, basename)
 
     # 각 폴더 배포
-    for d in sorted(
-        p for p in resource_dir.iterdir() if p.is_dir() and not p.name.startswith(".")
-    ):
-        if d.name.lower() == "thumbs":
-            continue
-        target = d / basename
-        _write_if_changed(target, css)
+    def _deploy(d: Path) -> None:
+        if _css_deployed(d, basename):
+            return
+        _link_or_write(root_target, d / basename, css)
         _cleanup_old_css(d, basename)
+        _mark_css_deployed(d, basename)
+
+    _for_each_dir(_list_card_dirs(resource_dir, entries), _deploy)
 
     log.info("[css] deployed %s to root and folders", basename)
     return basename
@@ -367,6 +587,47 @@ def _classes_for_meta(hidden: Optional[bool]) -> str:
     return (" " + " ".join(classes)) if classes else ""
 
 
+@lru_cache(maxsize=4096)
+def _escape_title(title: str) -> str:
+    """
+    폴더명(카드 제목)을 HTML 텍스트/속성 양쪽에 안전한 형태로 1회 escape.
+    같은 폴더가 master/child 양쪽에서 렌더되므로 결과를 메모해 재사용한다.
+    escape 대상 문자가 없으면(대부분의 폴더명/ID) 원문을 그대로 돌려준다.
+    """
+    if _NEEDS_ESCAPE_RE.search(title) is None:
+        return title
+    return _html_escape(title, quote=True)
+
+
+def _make_card_block_tpl(include_toolbar: bool, has_thumb: bool) -> str:
+    """_card_block_html용 format 템플릿(툴바/썸네일 조합 1개). 빈 조합도 기존 출력과 같은 줄 구성을 유지."""
+    toolbar = TOOLBAR_HTML.replace("{", "{{").replace("}", "}}") if include_toolbar else ""
+    # 빈 thumb-wrap 제거: 썸네일 있을 때만 출력
+    thumb_wrap = (
+        '<div class="thumb-wrap"><img class="thumb" src="{thumb_src}" alt="썸네일"/></div>'
+        if has_thumb
+        else ""
+    )
+    return (
+        '<div class="card{meta_cls}" data-card="{title}"{data_id_attr}{data_hidden}{data_order}>\n'
+        '  <div class="card-head">\n'
+        "    <h2>{title}</h2>\n"
+        f"    {toolbar}\n"
+        f"    {thumb_wrap}\n"
+        "  </div>\n"
+        '  <div class="inner{editable_cls}"{editable_attr}>\n'
+        "    {inner_html}\n"
+        "  </div>\n"
+        "</div>"
+    )
+
+
+# (include_toolbar, 썸네일 유무) → 카드 블록 템플릿
+_CARD_BLOCK_TPLS: Dict[Tuple[bool, bool], str] = {
+    (tb, th): _make_card_block_tpl(tb, th) for tb in (False, True) for th in (False, True)
+}
+
+
 def _card_block_html(
     title: str,
     inner_html: str,
@@ -378,33 +639,41 @@ def _card_block_html(
     include_toolbar: bool = False,
     editable: bool = False,
 ) -> str:
-    meta_cls = _classes_for_meta(hidden)
-    toolbar = TOOLBAR_HTML if include_toolbar else ""
-    # 빈 thumb-wrap 제거: 썸네일 있을 때만 출력
-    thumb_wrap = (
-        f'<div class="thumb-wrap"><img class="thumb" src="{thumb_src}" alt="썸네일"/></div>'
-        if thumb_src
-        else ""
-    )
-    editable_attr = ' contenteditable="true"' if editable else ""
-    editable_cls = " editable" if editable else ""
-    data_id_attr = f' data-card-id="{card_id}"' if card_id else ""
-    data_hidden = (
-        f' data-hidden="{str(bool(hidden)).lower()}"' if hidden is not None else ""
+    # 툴바 × 썸네일 조합별로 미리 만든 템플릿에 값만 채운다(분기/strip 반복 없음)
+    tpl = _CARD_BLOCK_TPLS[(bool(include_toolbar), bool(thumb_src))]
+    return tpl.format_map(
+        {
+            "meta_cls": _classes_for_meta(hidden),
+            "title": _escape_title(title),
+            "data_id_attr": f' data-card-id="{_escape_title(card_id)}"' if card_id else "",
+            "data_hidden": _DATA_HIDDEN_ATTRS[bool(hidden)] if hidden is not None else "",
+            "data_order": f' data-order="{order}"' if isinstance(order, int) else "",
+            "thumb_src": _escape_title(thumb_src) if thumb_src else thumb_src,
+            "editable_cls": " editable" if editable else "",
+            "editable_attr": ' contenteditable="true"' if editable else "",
+            "inner_html": inner_html,
+        }
     )
-    data_order = f' data-order="{order}"' if isinstance(order, int) else ""
-    return f"""
-<div class="card{meta_cls}" data-card="{title}"{data_id_attr}{data_hidden}{data_order}>
-  <div class="card-head">
-    <h2>{title}</h2>
-    {toolbar}
-    {thumb_wrap}
-  </div>
-  <div class="inner{editable_cls}"{editable_attr}>
-    {inner_html}
-  </div>
-</div>
-""".strip()
+
+
+# render_* 문서 골격(동적 값 앞뒤의 정적 조각은 모듈 로드 때 한 번만 만든다)
+_DOC_HEAD = (
+    "<!DOCTYPE html>\n"
+    '<html lang="ko">\n'
+    "<head>\n"
+    '  <meta charset="UTF-8"/>\n'
+    '  <meta name="viewport" content="width=device-width, initial-scale=1"/>\n'
+)
+_MASTER_HEAD_A = (
+    _DOC_HEAD
+    + "  <title>SukSuk Index — Master</title>\n"
+    + '  <link rel="stylesheet" href="'
+)
+_MASTER_HEAD_B = '"/>\n</head>\n<body>\n  '
+_CHILD_HEAD_A = _DOC_HEAD + "  <title>"
+_CHILD_HEAD_B = '</title>\n  <link rel="stylesheet" href="'
+_CHILD_HEAD_C = _MASTER_HEAD_B
+_DOC_TAIL = "\n</body>\n</html>"
 
 
 def render_master_index(
@@ -417,7 +686,9 @@ def render_master_index(
     """
     # 정렬은 호출 측(MasterApi._push_master_to_resource)이 책임지고,
     # 여기서는 전달받은 순서를 그대로 사용한다(SSOT = master_content 순서).
-    blocks: List[str] = []
+    # 정적 머리/꼬리 + 카드 블록을 parts에 모아 마지막에 join 1회(중간 문자열 복사 없음)
+    parts: List[str] = [_MASTER_HEAD_A, css_basename, _MASTER_HEAD_B]
+    first = True
     for f in folders:
         card_id = f.get("id") or f.get("card_id")
         hidden, order = _meta_from_dict(f)
@@ -425,7 +696,10 @@ def render_master_index(
         if hidden:
             continue
 
-        blocks.append(
+        if not first:
+            parts.append("\n")
+        first = False
+        parts.append(
             _card_block_html(
                 title=f.get("title", ""),
                 inner_html=f.get("html", ""),
@@ -437,24 +711,11 @@ def render_master_index(
                 editable=False,
             )
         )
-    blocks_html = "\n".join(blocks)
-    html = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-  <meta charset="UTF-8"/>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>SukSuk Index — Master</title>
-  <link rel="stylesheet" href="{css_basename}"/>
-</head>
-<body>
-  {blocks_html}
-</body>
-</html>
-""".strip()
+    parts.append(_DOC_TAIL)
 
-    # 배포 캐시에는 툴바가 없어야 하므로 전부 제거
-    return dedupe_toolbar(html, mode="child")
+    # 카드 블록은 include_toolbar=False로 만들고 본문도 sanitizer가 .card-actions를 제거해 오므로
+    # 배포 캐시에는 애초에 툴바가 없다 → dedupe_toolbar 재처리 불필요
+    return "".join(parts)
 
 
 def render_child_index(
@@ -479,51 +740,123 @@ def render_child_index(
         '<a class="back-to-master" href="../master_index.html">⬅ 전체 목록으로</a>'
     )
 
-    html = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-  <meta charset="UTF-8"/>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <title>{title}</title>
-  <link rel="stylesheet" href="{css_basename if css_basename.startswith('http') or css_basename.startswith('/') else '../' + css_basename}"/>
-</head>
-<body>
-  {block}
-  {back_link}
-</body>
-</html>
-""".strip()
+    css_href = (
+        css_basename
+        if css_basename.startswith("http") or css_basename.startswith("/")
+        else "../" + css_basename
+    )
+
+    # 카드 블록은 include_toolbar=False로 만들고 본문도 sanitizer가 .card-actions를 제거해 오므로
+    # 배포 캐시에는 애초에 툴바가 없다 → dedupe_toolbar 재처리 불필요
+    return "".join(
+        (
+            _CHILD_HEAD_A,
+            _escape_title(title),
+            _CHILD_HEAD_B,
+            css_href,
+            _CHILD_HEAD_C,
+            block,
+            "\n  ",
+            back_link,
+            _DOC_TAIL,
+        )
+    )
 
-    # 배포 캐시에는 툴바가 없어야 하므로 전부 제거
-    return dedupe_toolbar(html, mode="child")
+
+def _div_block_end(html: str, open_tag: "re.Match[str]") -> int:
+    """open_tag(<div ...>)와 짝이 맞는 </div> 끝 위치. 닫히지 않았으면 문서 끝."""
+    depth = 1
+    for t in _DIV_TAG_RE.finditer(html, open_tag.end()):
+        if t.group(1):
+            depth -= 1
+            if depth == 0:
+                return t.end()
+        elif not t.group(0).endswith("/>"):
+            depth += 1
+    return len(html)
 
 
 def dedupe_toolbar(html: str, *, mode: str = "master") -> str:
     """
-    mode="master": 각 .card마다 .card-actions 1개만 유지
-    mode="child" : .card-actions 전부 제거
-    """
-    soup = BeautifulSoup(html, "html.parser")
-    folders = soup.select(".card")
+    mode="master": 각 .card마다 .card-actions 1개만 유지(.card-head 밖이면 head 끝으로 이동)
+    mode="child" : .card 안의 .card-actions 전부 제거
 
-    for folder in folders:
-        actions = folder.select(".card-actions")
-        if not actions:
+    DOM 파싱 없이 div 태그 1패스로 카드 소속을 추적하고 문자열 구간만 편집한다.
+    - class는 공백 구분 토큰으로 비교(예: "card-actions hidden"), 속성 순서 무관
+    - 툴바 구간은 div 깊이를 세어 짝이 맞는 </div>까지
+    """
+    # 툴바 클래스 문자열이 아예 없으면 할 일이 없다(대부분의 사용자 HTML)
+    if "card-actions" not in html:
+        return html
+    child = mode == "child"
+
+    # (삽입/삭제 위치, 끝, 대체 문자열) 편집 목록을 모았다가 마지막에 한 번에 이어 붙인다.
+    edits: List[Tuple[int, int, str]] = []
+    # div 스택: (class 토큰, 소속 카드 번호)
+    stack: List[Tuple[List[str], Optional[int]]] = []
+    card_no = -1
+    kept: set[int] = set()
+    head_close: Dict[int, int] = {}  # 카드 번호 → .card-head 닫는 태그 위치
+    # head 밖에 있던 툴바: 카드 번호 → (마크업, 제거 편집의 인덱스)
+    # (카드가 끝날 때까지 .card-head가 안 나오면 제거를 취소해 제자리에 둔다)
+    pending: Dict[int, Tuple[str, int]] = {}
+    skip_until = -1
+
+    for tag in _DIV_TAG_RE.finditer(html):
+        if tag.start() < skip_until:
             continue
-
-        if mode == "child":
-            for node in actions:
-                node.decompose()
+        if tag.group(1):  # </div>
+            if not stack:
+                continue
+            classes, owner = stack.pop()
+            if owner is None:
+                continue
+            if "card-head" in classes:
+                head_close[owner] = tag.start()
+                if owner in pending:
+                    edits.append((tag.start(), tag.start(), pending.pop(owner)[0]))
+            elif "card" in classes and owner in pending:
+                idx = pending.pop(owner)[1]
+                edits[idx] = (edits[idx][0], edits[idx][0], "")
             continue
 
-        keep = actions[0]
-        for node in actions[1:]:
-            node.decompose()
-
-        head = folder.select_one(".card-head")
-        if head and keep.parent != head:
-            keep.extract()
-            head.append(keep)
+        classes = _class_tokens(tag.group(2))
+        owner = stack[-1][1] if stack else None
+        if "card" in classes:
+            card_no += 1
+            owner = card_no
+
+        if "card-actions" in classes and owner is not None:
+            start = tag.start()
+            end = skip_until = _div_block_end(html, tag)
+            if child or owner in kept:
+                edits.append((start, end, ""))
+                continue
+            kept.add(owner)
+            parent = stack[-1][0] if stack else []
+            if "card-head" not in parent:
+                block = html[start:end]
+                edits.append((start, end, ""))
+                if owner in head_close:
+                    edits.append((head_close[owner], head_close[owner], block))
+                else:
+                    pending[owner] = (block, len(edits) - 1)
+            continue
 
-    return str(soup)
+        if not tag.group(0).endswith("/>"):
+            stack.append((classes, owner))
+
+    for _, idx in pending.values():
+        edits[idx] = (edits[idx][0], edits[idx][0], "")
+
+    if not edits:
+        return html
+    edits.sort(key=lambda e: (e[0], e[1]))
+    parts: List[str] = []
+    pos = 0
+    for s_, e_, rep in edits:
+        parts.append(html[pos:s_])
+        parts.append(rep)
+        pos = max(pos, e_)
+    parts.append(html[pos:])
+    return "".join(parts)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 import json
 import logging
 
@@ -10,18 +11,80 @@ log = logging.getLogger("suksukidx")
 from datetime import datetime
 
 try:
-    from .fsutil import atomic_write_text
+    from .fsutil import atomic_write_bytes, read_text_utf8
 except Exception:
-    from fsutil import atomic_write_text
+    from fsutil import atomic_write_bytes, read_text_utf8
 
+from html.parser import HTMLParser
+
+# orjson이 있으면 (역)직렬화에 사용(출력 포맷은 json.dumps(indent=2, ensure_ascii=False)와 동일)
 try:
-    from bs4 import BeautifulSoup
+    import orjson
 except Exception:
-    BeautifulSoup = None
+    orjson = None
 
 _MISSING = object()
 
 
+class _CardMetaScanner(HTMLParser):
+    """
+    master_content에서 카드 메타만 뽑는 스트리밍 스캐너(DOM 미생성).
+
+    - <div class="... card ...">의 속성 dict와 첫 <h2> 텍스트만 수집
+    - h2 텍스트는 bs4 get_text(strip=True)처럼 조각별 strip 후 이어 붙임
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.cards: List[Dict[str, Any]] = []
+        self._div_depth = 0
+        # (시작 div 깊이, 카드 레코드) — 아직 닫히지 않은 카드들
+        self._open: List[Any] = []
+        # 현재 텍스트를 모으는 중인 카드들(첫 <h2> 안)
+        self._h2_targets: List[Dict[str, Any]] = []
+        self._h2_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div":
+            self._div_depth += 1
+            attr_map = dict(attrs)
+            if "card" in (attr_map.get("class") or "").split():
+                rec = {"attrs": attr_map, "title": None, "_parts": []}
+                self.cards.append(rec)
+                self._open.append((self._div_depth, rec))
+        elif tag == "h2":
+            if self._h2_depth == 0:
+                self._h2_targets = [
+                    rec for _, rec in self._open if rec["title"] is None
+                ]
+            self._h2_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        # <div/> 등 self-closing은 열고 바로 닫은 것으로 취급
+        self.handle_starttag(tag, attrs)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag == "div":
+            while self._open and self._open[-1][0] >= self._div_depth:
+                self._open.pop()
+            if self._div_depth > 0:
+                self._div_depth -= 1
+        elif tag == "h2" and self._h2_depth > 0:
+            self._h2_depth -= 1
+            if self._h2_depth == 0:
+                for rec in self._h2_targets:
+                    rec["title"] = "".join(rec.pop("_parts"))
+                self._h2_targets = []
+
+    def handle_data(self, data):
+        if self._h2_targets:
+            piece = data.strip()
+            if piece:
+                for rec in self._h2_targets:
+                    rec["_parts"].append(piece)
+
+
 class CardRegistry:
     """
     카드 ID ↔ 폴더 매핑 및 관련 메타를 관리하는 레지스트리.
@@ -34,27 +97,67 @@ class CardRegistry:
         self._registry_path = Path(registry_path)
         self._resource_dir = Path(resource_dir)
 
+        # 메모리 인덱스: 파일 시그니처(mtime_ns, size)가 같으면 재파싱/선형 탐색 생략
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_sig: Any = _MISSING
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_folder: Dict[str, Dict[str, Any]] = {}
+
+        # batch() 안에서는 save()를 메모리 반영만 하고, 마지막에 한 번만 디스크에 기록
+        self._batch_depth = 0
+        self._dirty = False
+
     # ---- 내부 유틸 ----
 
     def _empty(self) -> Dict[str, Any]:
         return {"version": 1, "items": []}
 
-    # ---- 기본 IO ----
-
-    def load(self) -> Dict[str, Any]:
-        """
-        레지스트리 JSON을 읽어 Dict 형태로 반환한다.
-        문제가 있으면 기본 구조를 반환한다.
-        """
+    def _file_sig(self) -> Any:
+        try:
+            st = self._registry_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _copy_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """최상위 dict + 항목 dict 단위 사본(인덱스와 호출 측 객체를 분리)."""
+        out = dict(data)
+        out["items"] = [dict(it) for it in data["items"]]
+        return out
+
+    def _reindex(self, data: Dict[str, Any], sig: Any) -> None:
+        by_id: Dict[str, Dict[str, Any]] = {}
+        by_folder: Dict[str, Dict[str, Any]] = {}
+        for it in data["items"]:
+            iid = it.get("id")
+            if iid is not None:
+                by_id.setdefault(iid, it)
+            folder = (it.get("folder") or "").strip()
+            if folder:
+                by_folder.setdefault(folder, it)
+        self._cache = data
+        self._cache_sig = sig
+        self._by_id = by_id
+        self._by_folder = by_folder
+
+    def _read_disk(self) -> Dict[str, Any]:
         path = self._registry_path
-        if not path.exists():
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return self._empty()
+        except Exception as exc:
+            log.warning("[registry] load failed: %s", str(exc))
             return self._empty()
 
         try:
-            text = path.read_text(encoding="utf-8")
-            if not text.strip():
+            if not raw.strip():
                 return self._empty()
-            data = json.loads(text)
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw.decode("utf-8"))
             if not isinstance(data, dict):
                 return self._empty()
             if "version" not in data:
@@ -66,10 +169,34 @@ class CardRegistry:
             log.warning("[registry] load failed: %s", str(exc))
             return self._empty()
 
+    def _current(self) -> Dict[str, Any]:
+        """
+        인덱스가 최신인 내부 데이터(공유 객체)를 반환한다.
+        외부에서 파일이 바뀌거나 삭제되면(reset 등) 시그니처 비교로 다시 읽는다.
+        """
+        if self._batch_depth and self._cache is not None:
+            # 배치 중에는 아직 기록 전인 변경분이 정본
+            return self._cache
+        sig = self._file_sig()
+        if self._cache is None or sig != self._cache_sig:
+            self._reindex(self._read_disk(), sig)
+        return self._cache  # type: ignore[return-value]
+
+    # ---- 기본 IO ----
+
+    def load(self) -> Dict[str, Any]:
+        """
+        레지스트리 JSON을 읽어 Dict 형태로 반환한다.
+        문제가 있으면 기본 구조를 반환한다.
+        (호출 측이 자유롭게 수정할 수 있도록 사본을 반환)
+        """
+        return self._copy_data(self._current())
+
     def save(self, data: Dict[str, Any]) -> None:
         """
         레지스트리를 디스크에 저장한다.
-        atomic_write_text를 사용해 부분 손상을 방지한다.
+        orjson(없으면 json)으로 bytes 직렬화한 뒤 atomic_write_bytes로 써서
+        부분 손상을 방지한다. batch() 안에서는 인덱스만 갱신하고 쓰기는 미룬다.
         """
         if not isinstance(data, dict):
             data = self._empty()
@@ -77,14 +204,48 @@ class CardRegistry:
             data["version"] = 1
         if "items" not in data or not isinstance(data["items"], list):
             data["items"] = []
+        # 내부 인덱스는 사본으로 보관: 저장 후 호출 측이 data를 고쳐도 인덱스가 따라 바뀌지 않게
+        if data is not self._cache:
+            data = self._copy_data(data)
+
+        if self._batch_depth:
+            self._reindex(data, self._cache_sig)
+            self._dirty = True
+            return
 
         path = self._registry_path
         path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            text = json.dumps(data, ensure_ascii=False, indent=2)
-            atomic_write_text(str(path), text, encoding="utf-8")
+            if orjson is not None:
+                payload = orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+            atomic_write_bytes(str(path), payload)
         except Exception as exc:
             log.error("[registry] save failed: %s", str(exc))
+            # 디스크와 어긋난 인덱스를 남기지 않도록 다음 조회에서 다시 읽게 한다
+            self._cache = None
+            return
+
+        self._reindex(data, self._file_sig())
+
+    @contextmanager
+    def batch(self) -> Iterator["CardRegistry"]:
+        """
+        여러 upsert/remove를 묶어 JSON 직렬화 + atomic write를 1회로 줄인다.
+        중첩 가능하며, 가장 바깥 블록이 끝날 때 변경이 있었으면 저장한다.
+        """
+        self._current()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self.save(self._cache)  # type: ignore[arg-type]
 
     def items(self) -> List[Dict[str, Any]]:
         data = self.load()
@@ -99,10 +260,9 @@ class CardRegistry:
         """
         card_id(=UUID)로 레지스트리 한 줄 찾기.
         """
-        for item in self.items():
-            if item.get("id") == card_id:
-                return dict(item)
-        return None
+        self._current()
+        item = self._by_id.get(card_id)
+        return dict(item) if item is not None else None
 
     def find_by_folder(self, folder: str) -> Optional[Dict[str, Any]]:
         """
@@ -111,10 +271,9 @@ class CardRegistry:
         folder = (folder or "").strip()
         if not folder:
             return None
-        for item in self.items():
-            if (item.get("folder") or "").strip() == folder:
-                return dict(item)
-        return None
+        self._current()
+        item = self._by_folder.get(folder)
+        return dict(item) if item is not None else None
 
     def upsert_item(
         self,
@@ -133,17 +292,10 @@ class CardRegistry:
         - folder/title/created_at/hidden 은 주어진 값만 덮어씀
         - created_at 은 기존 값이 없을 때만 세팅(이미 있으면 유지)
         """
-        data = self.load()
-        items = data.get("items")
-        if not isinstance(items, list):
-            items = []
-
-        item = None
-        for it in items:
-            if it.get("id") == card_id:
-                item = it
-                break
+        data = self._current()
+        items = data["items"]
 
+        item = self._by_id.get(card_id)
         if item is None:
             item = {"id": card_id}
             items.append(item)
@@ -169,33 +321,39 @@ class CardRegistry:
             else:
                 item["thumb_source"] = str(thumb_source)
 
-        data["items"] = items
         self.save(data)
-        return item
+        return dict(item)
 
     def remove_by_card_id(self, card_id: str) -> bool:
         """
         card_id 로 레지스트리에서 항목 제거.
         실제로 삭제되면 True, 없으면 False.
         """
-        data = self.load()
-        items = data.get("items")
-        if not isinstance(items, list):
+        data = self._current()
+        if card_id not in self._by_id:
             return False
-
-        new_items: List[Dict[str, Any]] = [
-            it for it in items if it.get("id") != card_id
-        ]
-        if len(new_items) == len(items):
-            return False
-
-        data["items"] = new_items
+        data["items"] = [it for it in data["items"] if it.get("id") != card_id]
         self.save(data)
         return True
 
-    def prune_missing_folders(self) -> int:
+    def remove_by_card_ids(self, card_ids: Iterable[str]) -> List[str]:
+        """
+        여러 card_id 를 한 번의 필터링/저장으로 제거.
+        반환값: 실제로 제거된 card_id 목록(입력 순서 유지)
+        """
+        data = self._current()
+        removed = [cid for cid in dict.fromkeys(card_ids) if cid in self._by_id]
+        if not removed:
+            return []
+        drop = set(removed)
+        data["items"] = [it for it in data["items"] if it.get("id") not in drop]
+        self.save(data)
+        return removed
+
+    def prune_missing_folders(self, existing_dirs: Optional[Set[str]] = None) -> int:
         """
         resource/ 에서 사라진 폴더를 가진 레지스트리 항목 정리.
+        - existing_dirs: 호출 측이 이미 스캔한 resource/ 폴더명 집합(있으면 is_dir 생략)
         반환값: 제거된 항목 수
         """
         data = self.load()
@@ -207,7 +365,11 @@ class CardRegistry:
         removed = 0
         for it in items:
             folder = (it.get("folder") or "").strip()
-            if folder and not (self._resource_dir / folder).is_dir():
+            if folder and not (
+                folder in existing_dirs
+                if existing_dirs is not None
+                else (self._resource_dir / folder).is_dir()
+            ):
                 removed += 1
             else:
                 kept.append(it)
@@ -220,7 +382,7 @@ class CardRegistry:
     # ---- master_content 기반 부트스트랩 ----
 
     def bootstrap_from_master(
-        self, master_content_path: Union[str, Path]
+        self, master_content_path: Union[str, Path], html: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         master_content.html 기반으로 ID 레지스트리를 재구성한다.
@@ -231,15 +393,16 @@ class CardRegistry:
         - master_content에 더 이상 존재하지 않는 id는 그대로 두되
           나중에 prune 단계에서 정리할 수 있도록 남겨둔다.
         - 실제 저장까지 수행하고, 최종 데이터를 반환한다.
+        - html: 호출 측이 이미 읽어 둔 master_content 텍스트(있으면 디스크 재읽기 생략)
         """
         master_path = Path(master_content_path)
-        if not master_path.exists():
+        try:
+            if html is None:
+                html = read_text_utf8(str(master_path))
+        except FileNotFoundError:
             data = self._empty()
             self.save(data)
             return data
-
-        try:
-            html = master_path.read_text(encoding="utf-8")
         except Exception as exc:
             log.error("[registry] bootstrap: read master_content failed: %s", str(exc))
             return self.load()
@@ -249,12 +412,15 @@ class CardRegistry:
             self.save(data)
             return data
 
-        if BeautifulSoup is None:
-            log.error("[registry] bootstrap: BeautifulSoup not available")
+        # 카드 속성/제목만 필요하므로 DOM 없이 스트리밍으로 스캔
+        scanner = _CardMetaScanner()
+        try:
+            scanner.feed(html)
+            scanner.close()
+        except Exception as exc:
+            log.error("[registry] bootstrap: scan master_content failed: %s", str(exc))
             return self.load()
-
-        soup = BeautifulSoup(html, "html.parser")
-        cards = soup.find_all("div", class_="card")
+        cards = scanner.cards
 
         reg = self.load()
         items_by_id: Dict[str, Dict[str, Any]] = {}
@@ -263,24 +429,22 @@ class CardRegistry:
             if iid:
                 items_by_id[iid] = dict(item)
 
-        for card_div in cards:
-            card_id = (card_div.get("data-card-id") or "").strip()
+        for card in cards:
+            attrs = card["attrs"]
+            title = (card["title"] or "").strip()
+
+            card_id = (attrs.get("data-card-id") or "").strip()
             if not card_id:
-                title_el = card_div.find("h2")
-                title_txt = (title_el.get_text(strip=True) if title_el else "").strip()
-                log.info("[registry] bootstrap: skip card without id (title=%s)", title_txt)
+                log.info("[registry] bootstrap: skip card without id (title=%s)", title)
                 continue
 
-            folder = (card_div.get("data-card") or "").strip()
-
-            title_el = card_div.find("h2")
-            title = (title_el.get_text(strip=True) if title_el else "").strip()
+            folder = (attrs.get("data-card") or "").strip()
 
-            hidden_attr = (card_div.get("data-hidden") or "").strip().lower()
-            classes = card_div.get("class") or []
+            hidden_attr = (attrs.get("data-hidden") or "").strip().lower()
+            classes = (attrs.get("class") or "").split()
             hidden = hidden_attr == "true" or ("is-hidden" in classes)
 
-            order_val = card_div.get("data-order")
+            order_val = attrs.get("data-order")
             try:
                 order = int(order_val) if order_val is not None else None
             except ValueError:
@@ -1,4 +1,4 @@
-import os, io, tempfile
+import os, tempfile
 
 ID_FILENAME = ".suksukidx.id"
 
@@ -28,18 +28,31 @@ def _atomic_replace(src_tmp: str, dst_path: str) -> None:
     _fsync_dir(dst_dir)
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    # 버퍼 계층 없이(write-through) 한 번에 기록; 부분 기록이면 남은 만큼 반복
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
 def atomic_write_bytes(
     dst_path: str, data: bytes, *, inherit_mode: bool = True
 ) -> None:
     dst_path = os.path.abspath(dst_path)
     dst_dir = os.path.dirname(dst_path) or "."
-    os.makedirs(dst_dir, exist_ok=True)
-    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=dst_dir)
+    # 상위 폴더는 대부분 이미 있으므로 makedirs는 tmp 생성이 실패했을 때만
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=dst_dir)
+    except FileNotFoundError:
+        os.makedirs(dst_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=dst_dir)
     try:
-        with os.fdopen(fd, "wb", closefd=True) as f:
-            f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         if inherit_mode:
             _inherit_mode(dst_path, tmp_path)
         _atomic_replace(tmp_path, dst_path)
@@ -59,26 +72,25 @@ def atomic_write_text(
     newline="\n",
     inherit_mode: bool = True
 ) -> None:
-    import io as _io, tempfile as _tempfile
+    # TextIOWrapper(8KiB 버퍼 + 증분 인코딩) 대신 한 번에 인코딩해서 bytes 경로로 기록.
+    # newline 의미는 open(..., newline=...) 쓰기 규칙과 동일하게 유지한다.
+    nl = os.linesep if newline is None else (newline or "\n")
+    if nl != "\n":
+        text = text.replace("\n", nl)
+    atomic_write_bytes(dst_path, text.encode(encoding), inherit_mode=inherit_mode)
 
-    dst_path = os.path.abspath(dst_path)
-    dst_dir = os.path.dirname(dst_path) or "."
-    os.makedirs(dst_dir, exist_ok=True)
-    fd, tmp_path = _tempfile.mkstemp(prefix=".tmp-", dir=dst_dir)
-    try:
-        with _io.open(fd, "w", encoding=encoding, newline=newline, closefd=True) as f:
-            f.write(text)
-            f.flush()
-            os.fsync(f.fileno())
-        if inherit_mode:
-            _inherit_mode(dst_path, tmp_path)
-        _atomic_replace(tmp_path, dst_path)
-    except Exception:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+
+def read_text_utf8(path: str, *, encoding: str = "utf-8") -> str:
+    """
+    파일 전체를 bytes로 한 번에 읽고 decode 한다(TextIOWrapper 경유 X).
+    Path.read_text()와 같은 결과가 되도록 개행(\r\n, \r)은 \n으로 정규화.
+    파일이 없으면 FileNotFoundError 를 그대로 올린다.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 # ---- 카드 ID 유틸 (P3-1) ----
@@ -1,5 +1,6 @@
 import re
-from typing import List, Dict, Any, Optional
+from html import unescape as _html_unescape
+from typing import List, Dict, Any, Optional, Tuple
 import os
 
 try:
@@ -8,6 +9,17 @@ except Exception:
     BeautifulSoup = None
     Comment = None
 
+# 카드 루프용 셀렉터: select()/select_one()이 매번 하는 컴파일 캐시 조회를 건너뛰도록 1회 컴파일
+# (soupsieve는 bs4 select()의 백엔드. 없으면 문자열 셀렉터 경로로 동작)
+try:
+    import soupsieve as _sv
+
+    _SEL_CARD = _sv.compile("div.card")
+    _SEL_CARD_H2 = _sv.compile(".card-head h2")
+except Exception:
+    _SEL_CARD = None
+    _SEL_CARD_H2 = None
+
 try:
     from .constants import MASTER_INDEX
 except Exception:
@@ -15,6 +27,25 @@ except Exception:
 
 _BODY_RE = re.compile(r"<body[^>]*>([\s\S]*?)</body>", re.I)
 
+# find_card_span용: div 여닫기 태그 / class 속성 / 문자열 스캔이 위험한 구간
+# (builder.dedupe_toolbar도 같은 정의를 가져다 쓴다)
+_DIV_TAG_RE = re.compile(r"<(/?)div\b([^>]*)>", re.I)
+_CLASS_ATTR_RE = re.compile(
+    r"""(?<![\w-])class\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I
+)
+_COMMENT_RE = re.compile(r"<!--[\s\S]*?-->")
+_UNSAFE_SPAN_RE = re.compile(r"<script\b|<style\b|<textarea\b", re.I)
+
+# scan_card_meta용: 카드 속성 값 / 제목 h2(단순 텍스트 형태만 신뢰)
+_DATA_CARD_RE = re.compile(
+    r"""(?<![\w-])data-card\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I
+)
+_DATA_CARD_ID_RE = re.compile(
+    r"""(?<![\w-])data-card-id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I
+)
+_H2_OPEN_RE = re.compile(r"<h2\b", re.I)
+_SIMPLE_H2_RE = re.compile(r"<h2>([^<]*)</h2>", re.I)
+
 _SKIP_PREFIX = re.compile(
     r"^(https?://|www\.|(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,}|/|\.\./|#|resource/|mailto:|tel:|data:)",
     re.I,
@@ -56,6 +87,22 @@ def _inner_html(el) -> str:
         return ""
 
 
+def select_cards(soup) -> list:
+    """soup.select("div.card")와 동일(미리 컴파일한 셀렉터 사용)."""
+    if _SEL_CARD is not None:
+        return _SEL_CARD.select(soup)
+    return soup.select("div.card")
+
+
+def card_title_h2(card):
+    """카드 제목 <h2>: .card-head h2 우선, 없으면 첫 h2. 없으면 None."""
+    if _SEL_CARD_H2 is not None:
+        h2 = _SEL_CARD_H2.select_one(card)
+    else:
+        h2 = card.select_one(".card-head h2")
+    return h2 or card.find("h2")
+
+
 def extract_folder_blocks(html: str) -> List[Dict[str, Any]]:
     """
     (호환 함수명) 마스터/차일드 HTML에서 <div class="card"> 블록들을 표준 스키마로 파싱.
@@ -70,9 +117,9 @@ def extract_folder_blocks(html: str) -> List[Dict[str, Any]]:
     soup = BeautifulSoup(html or "", "html.parser")
     out: List[Dict[str, Any]] = []
 
-    for folder in soup.select("div.card"):
+    for folder in select_cards(soup):
         # 1) 제목
-        h2 = folder.select_one(".card-head h2") or folder.find("h2")
+        h2 = card_title_h2(folder)
         title = _text(h2) if h2 else ""
 
         # 2) 썸네일
@@ -160,6 +207,112 @@ def prefix_resource_paths_for_root(html: str) -> str:
     return html
 
 
+def _class_tokens(attrs: str) -> List[str]:
+    """태그(또는 속성 문자열)의 class 값을 공백 구분 토큰 목록으로. data-class 등은 무시."""
+    m = _CLASS_ATTR_RE.search(attrs)
+    if not m:
+        return []
+    return next((g for g in m.groups() if g is not None), "").split()
+
+
+def find_card_span(html: str, card_id: str) -> Optional[Tuple[int, int]]:
+    """
+    div.card[data-card-id="<card_id>"] 블록의 (시작, 끝) 문자열 위치를 DOM 없이 찾는다.
+
+    - 문서 순서상 첫 번째 일치 카드(select_one과 동일)를 대상으로
+      <div>/</div> 깊이를 세어 짝이 맞는 닫는 태그까지를 구간으로 본다.
+    - div 태그를 품은 주석/script 등 문자열 스캔이 틀릴 수 있는 구간이 있거나
+      닫는 태그를 못 찾으면 None → 호출 측에서 DOM 경로로 폴백한다.
+    """
+    if not html or not card_id:
+        return None
+    open_re = re.compile(
+        r"<div\b[^>]*(?<![\w-])data-card-id\s*=\s*([\"'])" + re.escape(card_id) + r"\1[^>]*>",
+        re.I,
+    )
+    for m in open_re.finditer(html):
+        if "card" not in _class_tokens(m.group(0)):
+            continue
+
+        start = m.start()
+        # 주석 안에 들어 있는 여는 태그라면 문자열 스캔을 신뢰할 수 없음
+        cmt = html.rfind("<!--", 0, start)
+        if cmt >= 0 and html.find("-->", cmt) > start:
+            return None
+        depth = 1
+        for tag in _DIV_TAG_RE.finditer(html, m.end()):
+            if tag.group(1):
+                depth -= 1
+                if depth == 0:
+                    end = tag.end()
+                    if _UNSAFE_SPAN_RE.search(html, start, end):
+                        return None
+                    # 주석은 허용하되, 주석 속 div 태그나 구간 밖으로 걸친 주석은 폴백
+                    last_cmt = html.rfind("<!--", start, end)
+                    if last_cmt >= 0 and html.find("-->", last_cmt) + 3 > end:
+                        return None
+                    for cm in _COMMENT_RE.finditer(html, start, end):
+                        if _DIV_TAG_RE.search(cm.group(0)):
+                            return None
+                    return start, end
+            elif not tag.group(0).endswith("/>"):
+                depth += 1
+        return None
+    return None
+
+
+def _last_attr(regex: "re.Pattern[str]", tag: str) -> Optional[str]:
+    """태그 문자열에서 속성 값(중복 속성이면 html.parser처럼 마지막 값)을 unescape해서 반환."""
+    found = regex.findall(tag)
+    if not found:
+        return None
+    return _html_unescape(next((g for g in found[-1] if g), ""))
+
+
+def scan_card_meta(html: str) -> Optional[List[Tuple[Optional[str], Optional[str], Optional[str]]]]:
+    """
+    div.card 들의 (data-card, data-card-id, 제목 h2 텍스트)를 DOM 없이 문서 순서대로 모은다.
+
+    - 속성 값은 unescape만 하고 strip하지 않는다(card.get()과 같은 원값). 없으면 None.
+    - h2는 카드 여는 태그부터 다음 카드 전까지에서 찾고, 없으면 None.
+    - 주석 속 div, script/style/textarea, 제목 h2가 2개 이상이거나 단순 텍스트가 아닌 경우 등
+      문자열 스캔을 믿기 어려우면 None → 호출 측에서 DOM 경로로 폴백한다.
+    """
+    if _UNSAFE_SPAN_RE.search(html):
+        return None
+    for cm in _COMMENT_RE.finditer(html):
+        if _DIV_TAG_RE.search(cm.group(0)):
+            return None
+
+    opens: List[Tuple[int, int, str]] = []
+    for tag in _DIV_TAG_RE.finditer(html):
+        if tag.group(1):
+            continue
+        if "card" in _class_tokens(tag.group(2)):
+            opens.append((tag.start(), tag.end(), tag.group(0)))
+
+    out: List[Tuple[Optional[str], Optional[str], Optional[str]]] = []
+    for i, (_, tag_end, tag) in enumerate(opens):
+        seg_end = opens[i + 1][0] if i + 1 < len(opens) else len(html)
+        h2_text: Optional[str] = None
+        h2_starts = [m.start() for m in _H2_OPEN_RE.finditer(html, tag_end, seg_end)]
+        if len(h2_starts) > 1:
+            return None
+        if h2_starts:
+            hm = _SIMPLE_H2_RE.match(html, h2_starts[0], seg_end)
+            if hm is None:
+                return None
+            h2_text = _html_unescape(hm.group(1))
+        out.append(
+            (
+                _last_attr(_DATA_CARD_RE, tag),
+                _last_attr(_DATA_CARD_ID_RE, tag),
+                h2_text,
+            )
+        )
+    return out
+
+
 def strip_back_to_master(div_html: str) -> str:
     """child index의 '⬅ 전체 목록으로' 링크 제거(마스터에서는 불필요)"""
     if BeautifulSoup is None:
@@ -1,7 +1,7 @@
 # backend/pruner.py
 from __future__ import annotations
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Iterable
 from pathlib import Path
 import json
 import re
@@ -43,21 +43,27 @@ _HIDDEN_DIR = re.compile(r"^(\.|__pycache__|_tmp|_cache)$", re.I)
 # - thumbs: (구버전/테스트 잔재) 루트 공용 thumbs 폴더가 있을 수 있음
 _ROOT_SHARED_DIRS = {"thumbs"}
 
-def list_fs_slugs(resource_root: str | Path) -> Set[str]:
-    root = Path(resource_root)
-    if not root.exists():
-        return set()
+def list_fs_slugs(
+    resource_root: str | Path, dir_names: Optional[Iterable[str]] = None
+) -> Set[str]:
+    """
+    dir_names: 호출 측이 이미 스캔한 resource/ 하위 '폴더' 이름 목록.
+               주어지면 디렉토리를 다시 나열/stat하지 않고 이름 필터만 적용한다.
+    """
+    if dir_names is None:
+        root = Path(resource_root)
+        if not root.exists():
+            return set()
+        dir_names = [p.name for p in root.iterdir() if p.is_dir()]
     slugs: Set[str] = set()
-    for p in root.iterdir():
-        if not p.is_dir():
-            continue
-        if _HIDDEN_DIR.match(p.name):
+    for name in dir_names:
+        if _HIDDEN_DIR.match(name):
             continue
-        if p.name.lower() in _ROOT_SHARED_DIRS:
+        if name.lower() in _ROOT_SHARED_DIRS:
             continue
         # child index 용 폴더 판단: thumbs, css 등 상위 공용 폴더는 제외
         # 기준: 폴더 아래에 'index.html' 또는 임의의 리소스가 존재하는 “자료 폴더”
-        slugs.add(p.name)
+        slugs.add(name)
     return slugs
 
 
@@ -275,6 +281,7 @@ class DiffReporter:
         master_content_path: str | Path = MASTER_CONTENT_PATH,
         master_index_path: Optional[str | Path] = None,
         check_thumbs: bool = True,
+        fs_dir_names: Optional[Iterable[str]] = None,
     ) -> None:
         self.resource_root = Path(resource_root)
         self.master_content_path = Path(master_content_path)
@@ -285,9 +292,11 @@ class DiffReporter:
             else MASTER_INDEX_PATH
         )
         self.check_thumbs = check_thumbs
+        # 이미 스캔한 폴더 이름 목록(있으면 list_fs_slugs가 재스캔하지 않음)
+        self.fs_dir_names = fs_dir_names
 
     def make_report(self) -> PruneReport:
-        fs_slugs = list_fs_slugs(self.resource_root)
+        fs_slugs = list_fs_slugs(self.resource_root, self.fs_dir_names)
 
         mc_slugs = list_master_content_slugs(self.master_content_path)
         mi_slugs = list_master_index_slugs(self.master_index_path)
@@ -374,8 +383,10 @@ class PruneApplier:
             extract_inner_html_only,
             adjust_paths_for_folder,
             strip_back_to_master,
+            select_cards,
+            card_title_h2,
         )
-        from backend.builder import render_master_index, render_child_index
+        from backend.builder import render_master_index, render_child_index, dedupe_toolbar
         from backend.thumbs import _safe_name as _thumb_safe_name
 
         return (
@@ -384,7 +395,10 @@ class PruneApplier:
             strip_back_to_master,
             render_master_index,
             render_child_index,
+            dedupe_toolbar,
             _thumb_safe_name,
+            select_cards,
+            card_title_h2,
         )
 
     def _load_master_soup(self) -> "BeautifulSoup":
@@ -412,7 +426,10 @@ class PruneApplier:
             strip_back_to_master,
             render_master_index,
             render_child_index,
+            dedupe_toolbar,
             _thumb_safe_name,
+            select_cards,
+            card_title_h2,
         ) = self._imports()
 
         soup = self._load_master_soup()
@@ -423,9 +440,9 @@ class PruneApplier:
         targets = set(report.folders_missing_in_fs)
         if targets:
             # NOTE: .folder → .card 로 변경
-            for div in list(soup.select("div.card")):
+            for div in select_cards(soup):
                 # NOTE: .folder-head → .card-head 로 변경
-                title_el = div.select_one(".card-head h2") or div.find("h2")
+                title_el = card_title_h2(div)
                 title = (title_el.get_text(strip=True) if title_el else "").strip()
                 # NOTE: data-folder 뿐 아니라 data-card도 함께 고려
                 data_folder = (div.get("data-folder") or "").strip()
@@ -448,9 +465,9 @@ class PruneApplier:
             for slug in report.child_indexes_missing:
                 div = None
                 # NOTE: .folder → .card
-                for cand in soup.select("div.card"):
+                for cand in select_cards(soup):
                     # NOTE: .folder-head → .card-head
-                    h = cand.select_one(".card-head h2") or cand.find("h2")
+                    h = card_title_h2(cand)
                     tt = (h.get_text(strip=True) if h else "").strip()
                     # NOTE: data-folder + data-card 모두 지원
                     df = (cand.get("data-folder") or "").strip()
@@ -460,7 +477,9 @@ class PruneApplier:
                         break
                 if not div:
                     continue
-                inner_only = extract_inner_html_only(str(div))
+                # sanitizer를 거치지 않는 경로라 render 전에 편집 툴바를 직접 제거
+                # (child 모드는 .card 안의 툴바만 지우므로 카드 div째로 넘긴 뒤 inner를 꺼낸다)
+                inner_only = extract_inner_html_only(dedupe_toolbar(str(div), mode="child"))
                 inner_for_folder = adjust_paths_for_folder(
                     inner_only, slug, for_resource_master=False
                 )
@@ -477,13 +496,13 @@ class PruneApplier:
         # 4) master_index 재렌더 (master_content → 목록 생성)
         folders_for_master: List[Dict[str, Optional[str]]] = []
         # NOTE: .folder → .card
-        for div in soup.select("div.card"):
+        for div in select_cards(soup):
             # NOTE: .folder-head → .card-head
-            h2 = div.select_one(".card-head h2") or div.find("h2")
+            h2 = card_title_h2(div)
             title = (h2.get_text(strip=True) if h2 else "").strip()
             if not title:
                 continue
-            inner_only = extract_inner_html_only(str(div))
+            inner_only = extract_inner_html_only(dedupe_toolbar(str(div), mode="child"))
             inner_for_master = adjust_paths_for_folder(
                 inner_only, title, for_resource_master=True
             )
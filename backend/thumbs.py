@@ -4,6 +4,8 @@ import subprocess, sys, shlex
 import tempfile
 import re, unicodedata
 from io import BytesIO
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import logging
@@ -17,6 +19,9 @@ except ImportError:  # 스크립트 모드 대비
 BASE_DIR = Path(__file__).parent
 log = logging.getLogger("suksukidx")
 
+# 썸네일 일괄 생성 병렬 워커 수(외부 프로세스 동시 실행 상한 4)
+_THUMB_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
 BIN_DIR = BASE_DIR / "bin"
 FFMPEG_EXE = BIN_DIR / "ffmpeg.exe"
 PDFTOPPM_EXE = BIN_DIR / "poppler" / "pdftoppm.exe"  # bin/poppler
@@ -83,19 +88,19 @@ def _run(cmd: list[str]) -> tuple[int, str, str]:
         return 1, "", f"Exception: {e}"
 
 
+_WS_RE = re.compile(r"[\s\u00A0\u202F\u2009\u2007\u2060]+")
+_FORBIDDEN_TRANS = str.maketrans({c: "_" for c in r'\/:*?"<>|'})
+
+
+@lru_cache(maxsize=1024)
 def _safe_name(name: str) -> str:
     # 폴더 → 썸네일 파일명 규칙: 공백은 _ 로, 금지문자는 _ 로
     # 유니코드 표준화(NFKC)로 보기엔 공백인데 다른 문자 문제 완화
+    # (순수 함수 + push/sync에서 같은 제목으로 반복 호출 → 결과 메모이즈)
     name = unicodedata.normalize("NFKC", name)
     # 모든 공백류(스페이스, 탭, NBSP, 얇은공백 등)를 '_'로
-    name = re.sub(r"[\s\u00A0\u202F\u2009\u2007\u2060]+", "_", name)
-    out = []
-    for c in name:
-        if c in r'\/:*?"<>|':
-            out.append("_")
-        else:
-            out.append(c)
-    return "".join(out)
+    name = _WS_RE.sub("_", name)
+    return name.translate(_FORBIDDEN_TRANS)
 
 
 def _which(exe_path: Path, fallback: str) -> str:
@@ -110,21 +115,19 @@ def _ascii_tmp_prefix(out_jpg: Path) -> tuple[Path, Path]:
     r"""
     ASCII 전용 임시 디렉터리에 파일 prefix를 만든다.
     반환: (tmp_dir, tmp_prefix)
-    예) C:\Users\<me>\AppData\Local\Temp\pdfthumb_tmp\out_temp_pdfthumb
+    예) C:\Users\<me>\AppData\Local\Temp\pdfthumb_tmp\job_xxxx\out_temp_pdfthumb
+    - 썸네일을 병렬로 만들 수 있도록 호출마다 고유한 하위 폴더를 쓴다.
     """
     base_tmp = Path(tempfile.gettempdir()) / "pdfthumb_tmp"
     base_tmp.mkdir(parents=True, exist_ok=True)
-    tmp_prefix = base_tmp / "out_temp_pdfthumb"
-    return base_tmp, tmp_prefix
+    tmp_dir = Path(tempfile.mkdtemp(prefix="job_", dir=base_tmp))
+    tmp_prefix = tmp_dir / "out_temp_pdfthumb"
+    return tmp_dir, tmp_prefix
 
 
 def _cleanup_tmp_dir(tmp_dir: Path):
-    try:
-        # 너무 자주 지우면 경쟁조건 날 수 있으니, 파일만 지우고 폴더는 남겨도 OK
-        for p in tmp_dir.glob("out_temp_pdfthumb*"):
-            p.unlink(missing_ok=True)
-    except Exception:
-        pass
+    # 호출 전용 폴더이므로 통째로 지워도 다른 작업과 경쟁하지 않음
+    shutil.rmtree(tmp_dir, ignore_errors=True)
 
 
 def _pdf_num_pages(pdf_path: Path) -> int | None:
@@ -377,34 +380,45 @@ def scan_and_make_thumbs(
         * 캡처 후보가 없으면 기존 썸네일만 삭제
     """
     resource_dir = Path(resource_dir)
-    any_error = False
+    folders = list(_iter_content_folders(resource_dir))
 
-    for folder in _iter_content_folders(resource_dir):
-        try:
-            kind, src = _find_capture_candidate(folder)
-            safe_name = _safe_name(folder.name)
-            thumb_file = folder / "thumbs" / f"{safe_name}.jpg"
-
-            # 1) 캡처 후보 없음 → 기존 썸네일이 있다면 삭제
-            if not src:
-                if thumb_file.exists():
-                    try:
-                        thumb_file.unlink()
-                        log.info("[thumb] removed orphan thumb (no source): %s", str(thumb_file))
-                    except Exception as e:
-                        log.warning("[thumb] WARN: failed to remove orphan thumb %s: %s", str(thumb_file), str(e))
-                        any_error = True
-                continue
-
-            # 2) 후보는 있는데, refresh=False 이고 썸네일이 이미 있으면 → 그대로 유지
-            if not refresh and thumb_file.exists():
-                continue
-
-            # 3) 이외의 경우에만 실제 썸네일 생성/갱신
-            ok, _src = make_thumbnail_for_folder(folder, max_width=width)
-            # ok=False(변환 실패 등)는 전체 스캔 실패로 보지 않고 넘어감
-        except Exception as e:
-            log.error("[thumb] ERROR in %s: %s", folder.name, str(e))
-            any_error = True
+    # 폴더별 작업은 ffmpeg/pdftoppm 서브프로세스·이미지 I/O 대기가 대부분 → 스레드 풀로 병렬 처리
+    if len(folders) > 1:
+        with ThreadPoolExecutor(max_workers=min(_THUMB_WORKERS, len(folders))) as pool:
+            results = list(pool.map(lambda f: _scan_one_folder(f, refresh, width), folders))
+    else:
+        results = [_scan_one_folder(f, refresh, width) for f in folders]
+
+    return all(results)
+
+
+def _scan_one_folder(folder: Path, refresh: bool, width: int) -> bool:
+    """scan_and_make_thumbs의 폴더 1개 처리. 오류가 있었으면 False."""
+    try:
+        kind, src = _find_capture_candidate(folder)
+        safe_name = _safe_name(folder.name)
+        thumb_file = folder / "thumbs" / f"{safe_name}.jpg"
+
+        # 1) 캡처 후보 없음 → 기존 썸네일이 있다면 삭제
+        if not src:
+            if thumb_file.exists():
+                try:
+                    thumb_file.unlink()
+                    log.info("[thumb] removed orphan thumb (no source): %s", str(thumb_file))
+                except Exception as e:
+                    log.warning("[thumb] WARN: failed to remove orphan thumb %s: %s", str(thumb_file), str(e))
+                    return False
+            return True
+
+        # 2) 후보는 있는데, refresh=False 이고 썸네일이 이미 있으면 → 그대로 유지
+        if not refresh and thumb_file.exists():
+            return True
+
+        # 3) 이외의 경우에만 실제 썸네일 생성/갱신
+        ok, _src = make_thumbnail_for_folder(folder, max_width=width)
+        # ok=False(변환 실패 등)는 전체 스캔 실패로 보지 않고 넘어감
+    except Exception as e:
+        log.error("[thumb] ERROR in %s: %s", folder.name, str(e))
+        return False
 
-    return not any_error
+    return True
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# validate_toolbar.py
+# dedupe_toolbar(문자열 구간 편집)가 기존 bs4 구현과 같은 DOM을 만드는지 확인
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    print("BeautifulSoup4가 필요합니다. 설치: pip install beautifulsoup4")
+    sys.exit(2)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from backend.builder import dedupe_toolbar, TOOLBAR_HTML  # noqa: E402
+from backend.pruner import PruneApplier  # noqa: E402
+
+
+def _reference(html: str, mode: str) -> str:
+    """기존(bs4) dedupe_toolbar 동작."""
+    soup = BeautifulSoup(html, "html.parser")
+    for folder in soup.select(".card"):
+        actions = folder.select(".card-actions")
+        if not actions:
+            continue
+        if mode == "child":
+            for node in actions:
+                node.decompose()
+            continue
+        keep = actions[0]
+        for node in actions[1:]:
+            node.decompose()
+        head = folder.select_one(".card-head")
+        if head and keep.parent != head:
+            keep.extract()
+            head.append(keep)
+    return str(soup)
+
+
+def _norm(html: str) -> str:
+    return str(BeautifulSoup(html, "html.parser"))
+
+
+HIDDEN_BAR = (
+    '<div class="card-actions hidden">'
+    '<button class="btn btnEditOne">편집</button>'
+    '<button class="btn btnSaveOne" disabled>저장</button></div>'
+)
+REORDERED_BAR = '<div data-x="1" class="card-actions"><button class="btn">b</button></div>'
+NESTED_BAR = '<div class="card-actions"><div class="grp"><button>x</button></div></div>'
+
+CASES = {
+    "toolbar in head": (
+        f'<div class="card"><div class="card-head"><h2>A</h2>{TOOLBAR_HTML}</div>'
+        '<div class="inner">x</div></div>'
+    ),
+    "card-actions hidden, twice, outside head": (
+        f'<div class="card"><div class="card-head"><h2>A</h2></div>'
+        f'{HIDDEN_BAR}<div class="inner">x</div>{HIDDEN_BAR}</div>'
+    ),
+    "toolbar before head": (
+        f'<div class="card">{HIDDEN_BAR}<div class="card-head"><h2>A</h2></div>'
+        '<div class="inner">x</div></div>'
+    ),
+    "reordered attributes": (
+        f'<div class="card" data-card="A"><div class="card-head"><h2>A</h2></div>'
+        f'<div class="inner">{REORDERED_BAR}</div></div>'
+    ),
+    "nested div in toolbar": (
+        f'<div class="card"><div class="card-head"><h2>A</h2></div>'
+        f'<div class="inner">{NESTED_BAR}{NESTED_BAR}</div></div>'
+    ),
+    "card without head": f'<div class="card">{HIDDEN_BAR}<p>x</p>{HIDDEN_BAR}</div>',
+    "toolbar outside any card": f'<section>{HIDDEN_BAR}</section><div class="card"><h2>B</h2></div>',
+    "data-class is not class": '<div class="card"><div data-class="card-actions">keep</div></div>',
+    "two cards": (
+        f'<div class="card"><div class="card-head"><h2>A</h2></div>{HIDDEN_BAR}</div>\n'
+        f'<div class="card"><div class="card-head"><h2>B</h2>{REORDERED_BAR}</div>{TOOLBAR_HTML}</div>'
+    ),
+}
+
+
+def _check_prune() -> int:
+    """prune_apply 경로(카드 inner만 꺼내 렌더)에서도 툴바가 child/master index에 남지 않아야 한다."""
+    base = Path(tempfile.mkdtemp(prefix="tbchk"))
+    try:
+        res = base / "resource"
+        (res / "A").mkdir(parents=True)
+        mc = base / "backend" / "master_content.html"
+        mc.parent.mkdir(parents=True)
+        mc.write_text(
+            f'<div class="card" data-card="A"><div class="card-head"><h2>A</h2></div>'
+            f'<div class="inner"><p>x</p>{TOOLBAR_HTML}{HIDDEN_BAR}</div></div>',
+            encoding="utf-8",
+        )
+        mi = res / "master_index.html"
+        PruneApplier(resource_root=res, master_content_path=mc, master_index_path=mi).apply()
+        failed = 0
+        for out in (res / "A" / "index.html", mi):
+            if not out.exists() or "card-actions" in out.read_text(encoding="utf-8"):
+                failed += 1
+                print(f"[FAIL] prune_apply left a toolbar in {out.relative_to(base)}")
+        return failed
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def main() -> int:
+    failed = _check_prune()
+    for name, html in CASES.items():
+        for mode in ("master", "child"):
+            got = _norm(dedupe_toolbar(html, mode=mode))
+            want = _norm(_reference(html, mode))
+            if got != want:
+                failed += 1
+                print(f"[FAIL] {name} ({mode})\n  got : {got}\n  want: {want}")
+    total = len(CASES) * 2 + 2  # + prune_apply 출력 2개(child, master index)
+    print(f"[toolbar] {total - failed}/{total} ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())